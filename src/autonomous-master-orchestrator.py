@@ -19,37 +19,51 @@ Version: 1.0.0
 import os
 import sys
 import asyncio
+import argparse
 import json
 import logging
+import logging.handlers
+import queue
 import subprocess
 import threading
 import time
 import signal
+import stat
 import traceback
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Union, Tuple
-from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Any, Union, Tuple, AsyncIterator, Iterator, Sequence, Set
+from dataclasses import dataclass, field, replace
 from enum import Enum
+from collections import deque, OrderedDict
+from itertools import islice
+from array import array
 import psutil
 import yaml
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
 from datetime import datetime, timedelta
 import hashlib
+import heapq
 import sqlite3
 from contextlib import contextmanager
 import shutil
 import tempfile
 import uuid
-from watchdog.observers import Observer
-from watchdog.events import FileSystemEventHandler
-import redis
-import docker
-from functools import wraps
+from functools import wraps, lru_cache
 import mimetypes
+import mmap
 import re
 import aiofiles
-import aiohttp
-from tenacity import retry, stop_after_attempt, wait_exponential
+import orjson
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader
+
+try:
+    import re2  # Linear-time matching for patterns run against project files
+except ImportError:
+    re2 = None
 
 # Configure logging
 logging.basicConfig(
@@ -100,7 +114,10 @@ class AgentRole(Enum):
     RESEARCHER = "researcher"
     DOCUMENTATION = "documentation"
 
-@dataclass
+# Slotted configs drop the per-instance __dict__; slots=True needs Python 3.10+
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_SLOTS)
 class ProjectConfig:
     """Project configuration"""
     name: str
@@ -112,14 +129,14 @@ class ProjectConfig:
     confidence: float = 0.8
     claude_config: Optional[Dict[str, Any]] = None
     
-@dataclass
+@dataclass(**_SLOTS)
 class AgentConfig:
     """Agent configuration"""
     role: AgentRole
     session_name: str
     window_name: str
-    capabilities: List[str] = field(default_factory=list)
-    tools: List[str] = field(default_factory=list)
+    capabilities: Sequence[str] = field(default_factory=list)
+    tools: Sequence[str] = field(default_factory=list)
     active: bool = True
     
 @dataclass
@@ -131,11 +148,61 @@ class ResourceMetrics:
     network_io: Dict[str, int]
     timestamp: datetime = field(default_factory=datetime.now)
 
+class MetricsBuffer:
+    """Fixed-size ring buffer of resource samples stored as parallel typed arrays"""
+    
+    def __init__(self, capacity: int = 2880):
+        self.capacity = capacity
+        self.cpu = array('f', bytes(4 * capacity))
+        self.memory = array('f', bytes(4 * capacity))
+        self.disk = array('f', bytes(4 * capacity))
+        self.ts = array('q', bytes(8 * capacity))
+        self.head = 0
+        
+    def __len__(self) -> int:
+        return min(self.head, self.capacity)
+    
+    def record(self, cpu_percent: float, memory_percent: float, disk_usage: float) -> None:
+        """Write one sample over the oldest slot"""
+        i = self.head % self.capacity
+        self.cpu[i] = cpu_percent
+        self.memory[i] = memory_percent
+        self.disk[i] = disk_usage
+        self.ts[i] = time.time_ns()
+        self.head += 1
+        
+    def mean(self, column: str) -> float:
+        """Mean of a column over the buffered window"""
+        n = len(self)
+        return sum(getattr(self, column)[:n]) / n if n else 0.0
+    
+    def percentile(self, column: str, q: float) -> float:
+        """Linearly interpolated percentile of a column over the buffered window"""
+        n = len(self)
+        if not n:
+            return 0.0
+        values = sorted(getattr(self, column)[:n])
+        k = (n - 1) * q / 100
+        lo = int(k)
+        hi = min(lo + 1, n - 1)
+        return values[lo] + (values[hi] - values[lo]) * (k - lo)
+    
+    def summary(self) -> Dict[str, Any]:
+        """Windowed mean and p95 for every column"""
+        return {
+            'samples': len(self),
+            **{f'{column}_mean': round(self.mean(column), 2) for column in ('cpu', 'memory', 'disk')},
+            **{f'{column}_p95': round(self.percentile(column, 95), 2) for column in ('cpu', 'memory', 'disk')},
+        }
+
 class MemoryManager:
     """Advanced memory management system"""
     
     def __init__(self, redis_url: str = "redis://localhost:6379"):
-        self.redis_client = redis.from_url(redis_url) if redis_url else None
+        self.redis_client = None
+        if redis_url:
+            import redis  # Deferred: only the memory manager needs the Redis client
+            self.redis_client = redis.from_url(redis_url)
         self.memory_limits = {
             'agent': 1024 * 1024 * 500,  # 500MB per agent
             'system': 1024 * 1024 * 2048,  # 2GB system limit
@@ -143,16 +210,21 @@ class MemoryManager:
         }
         self.cleanup_interval = 300  # 5 minutes
         self.last_cleanup = time.time()
+        self.process = psutil.Process()
+        self.key_prefix = 'orch:'  # Namespace for orchestrator-owned Redis keys
+        self.eviction_batch_size = 500
         
     def check_memory_usage(self) -> Dict[str, float]:
         """Check current memory usage"""
-        process = psutil.Process()
-        memory_info = process.memory_info()
+        # oneshot() reads the process stats once for both queries
+        with self.process.oneshot():
+            memory_info = self.process.memory_info()
+            memory_percent = self.process.memory_percent()
         
         return {
             'rss': memory_info.rss,
             'vms': memory_info.vms,
-            'percent': process.memory_percent(),
+            'percent': memory_percent,
             'available': psutil.virtual_memory().available
         }
     
@@ -171,18 +243,33 @@ class MemoryManager:
         # Clean Redis cache if available
         if self.redis_client:
             try:
-                # Remove expired keys
-                self.redis_client.flushdb()
-                logger.info("Redis cache cleaned")
+                # Keys expire through their TTL; only evict our namespace under memory pressure
+                used_memory = self.redis_client.info('memory').get('used_memory', 0)
+                if used_memory > self.memory_limits['cache']:
+                    evicted = self._evict_context_keys()
+                    logger.info(f"Redis cache cleaned: evicted {evicted} context keys")
             except Exception as e:
                 logger.warning(f"Redis cleanup failed: {e}")
     
+    def _evict_context_keys(self) -> int:
+        """Unlink orchestrator-owned keys in batches without blocking Redis"""
+        evicted = 0
+        pipe = self.redis_client.pipeline(transaction=False)
+        for key in self.redis_client.scan_iter(match=f'{self.key_prefix}*', count=self.eviction_batch_size):
+            pipe.unlink(key)
+            evicted += 1
+            if evicted % self.eviction_batch_size == 0:
+                pipe.execute()
+        pipe.execute()
+        return evicted
+    
     def store_context(self, key: str, data: Any, ttl: int = 3600) -> bool:
         """Store context data with TTL"""
         try:
             if self.redis_client:
-                serialized = json.dumps(data)
-                self.redis_client.setex(key, ttl, serialized)
+                # orjson handles dataclasses, datetimes and enums natively
+                serialized = orjson.dumps(data, default=str)
+                self.redis_client.setex(f'{self.key_prefix}{key}', ttl, serialized)
                 return True
             return False
         except Exception as e:
@@ -193,19 +280,87 @@ class MemoryManager:
         """Retrieve context data"""
         try:
             if self.redis_client:
-                data = self.redis_client.get(key)
+                data = self.redis_client.get(f'{self.key_prefix}{key}')
                 if data:
-                    return json.loads(data)
+                    return orjson.loads(data)
             return None
         except Exception as e:
             logger.error(f"Context retrieval failed: {e}")
             return None
 
+# Detection results older than this, or beyond the newest rows, are pruned when the cache opens
+_DETECTION_CACHE_MAX_AGE = 30 * 24 * 3600
+_DETECTION_CACHE_MAX_ROWS = 4096
+
+def _default_detection_cache_path() -> str:
+    """Detection cache in the user's own cache directory"""
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(cache_home, 'ultimate-workflow-orchestration', 'detect-cache.db')
+
 class ProjectDetector:
     """Advanced project detection system"""
     
-    def __init__(self):
-        self.detection_rules = self._load_detection_rules()
+    def __init__(self, cache_path: Optional[str] = None):
+        self.detection_rules = self._compile_detection_rules(self._load_detection_rules())
+        # Nested paths the rules and phase detection probe; their stats are part of the cache signature
+        self.nested_probes = tuple(sorted({
+            check[0] for rule in self.detection_rules.values() for check in rule['checks']
+            if '/' in check[0].rstrip('/')
+        } | {'.github/workflows'}))
+        self.cache_db = self._open_detection_cache(cache_path or _default_detection_cache_path())
+        
+    def _open_detection_cache(self, cache_path: str) -> Optional[sqlite3.Connection]:
+        """Open the persistent detection cache, or return None if it is unavailable"""
+        try:
+            # Private to the user: results are trusted on load, so nobody else may write them
+            os.makedirs(os.path.dirname(cache_path), mode=0o700, exist_ok=True)
+            os.close(os.open(cache_path, os.O_RDWR | os.O_CREAT, 0o600))
+            os.chmod(cache_path, 0o600)
+            
+            db = sqlite3.connect(cache_path, isolation_level=None)
+            db.execute('PRAGMA journal_mode=WAL')
+            db.execute('PRAGMA synchronous=NORMAL')
+            db.execute(
+                'CREATE TABLE IF NOT EXISTS detections(path TEXT PRIMARY KEY, sig BLOB, result BLOB, stored_at REAL)'
+            )
+            db.execute('DELETE FROM detections WHERE stored_at < ?', (time.time() - _DETECTION_CACHE_MAX_AGE,))
+            db.execute(
+                'DELETE FROM detections WHERE path NOT IN '
+                '(SELECT path FROM detections ORDER BY stored_at DESC LIMIT ?)',
+                (_DETECTION_CACHE_MAX_ROWS,)
+            )
+            return db
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Detection cache disabled: {e}")
+            return None
+    
+    def _load_cached_detection(self, path: str, sig: bytes) -> Optional[ProjectConfig]:
+        """Return the cached detection result if the directory signature still matches"""
+        if self.cache_db is None:
+            return None
+        try:
+            row = self.cache_db.execute('SELECT sig, result FROM detections WHERE path = ?', (path,)).fetchone()
+            if row is None or row[0] != sig:
+                return None
+            data = orjson.loads(row[1])
+            data['type'] = ProjectType(data['type'])
+            data['phase'] = ProjectPhase(data['phase'])
+            return ProjectConfig(**data)
+        except (sqlite3.Error, orjson.JSONDecodeError, TypeError, ValueError, KeyError) as e:
+            logger.warning(f"Ignoring cached detection for {path}: {e}")
+            return None
+    
+    def _store_cached_detection(self, sig: bytes, config: ProjectConfig):
+        """Write a detection result through to the persistent cache"""
+        if self.cache_db is None:
+            return
+        try:
+            self.cache_db.execute(
+                'INSERT OR REPLACE INTO detections(path, sig, result, stored_at) VALUES (?, ?, ?, ?)',
+                (config.path, sig, orjson.dumps(config, default=str), time.time())
+            )
+        except (sqlite3.Error, TypeError) as e:
+            logger.warning(f"Failed to cache detection for {config.path}: {e}")
         
     def _load_detection_rules(self) -> Dict[str, Dict[str, Any]]:
         """Load project detection rules"""
@@ -281,6 +436,33 @@ class ProjectDetector:
             }
         }
     
+    def _compile_detection_rules(self, rules: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """Precompile patterns and pattern counts so scoring does not recompute them"""
+        for rule in rules.values():
+            patterns = rule.get('patterns', [])
+            for pattern in patterns:
+                for key in ('regex', 'content'):
+                    if isinstance(pattern.get(key), str):
+                        pattern[key] = self._compile_pattern(pattern[key])
+            rule['pattern_count'] = len(patterns)
+            rule['required_count'] = sum(1 for p in patterns if p.get('required', False))
+            # Flattened (path, type, required, regex, content) checks for the scoring loop
+            rule['checks'] = tuple(
+                (p['path'], p['type'], p.get('required', False), p.get('regex'), p.get('content'))
+                for p in patterns
+            )
+            rule.setdefault('weight', 1.0)
+        return rules
+    
+    def _compile_pattern(self, pattern: str):
+        """Compile with RE2 when available so file contents cannot trigger catastrophic backtracking"""
+        if re2 is not None:
+            try:
+                return re2.compile(pattern)
+            except Exception:
+                logger.debug(f"RE2 cannot compile {pattern!r}, falling back to re")
+        return re.compile(pattern)
+    
     async def detect_project(self, project_path: str) -> ProjectConfig:
         """Detect project type and configuration"""
         path = Path(project_path)
@@ -290,9 +472,24 @@ class ProjectDetector:
         scores = {}
         detected_technologies = set()
         
-        # Analyze each detection rule
-        for project_type, rule in self.detection_rules.items():
-            score = await self._calculate_rule_score(path, rule)
+        # Per-detection caches so each file is stat-ed and read at most once across rules
+        file_cache: Dict[str, asyncio.Future] = {}
+        stat_cache: Dict[str, Tuple[bool, bool]] = {}
+        
+        # One top-level directory read answers every non-nested probe; with the nested probes it fingerprints the tree
+        entries, sig = self._scan_entries(path, stat_cache)
+        
+        cached = self._load_cached_detection(str(path), sig)
+        if cached is not None:
+            return cached
+        
+        # Analyze all detection rules concurrently
+        rule_scores = await asyncio.gather(*[
+            self._calculate_rule_score(path, rule, entries, file_cache, stat_cache)
+            for rule in self.detection_rules.values()
+        ])
+        
+        for (project_type, rule), score in zip(self.detection_rules.items(), rule_scores):
             if score > 0:
                 scores[project_type] = score
                 detected_technologies.update(rule.get('technologies', []))
@@ -307,12 +504,12 @@ class ProjectDetector:
             project_type = ProjectType(best_match)
         
         # Detect project phase
-        phase = await self._detect_project_phase(path)
+        phase = await self._detect_project_phase(path, entries)
         
         # Check for CLAUDE.md
         claude_config = await self._detect_claude_config(path)
         
-        return ProjectConfig(
+        config = ProjectConfig(
             name=path.name,
             path=str(path),
             type=project_type,
@@ -321,46 +518,42 @@ class ProjectDetector:
             confidence=confidence,
             claude_config=claude_config
         )
+        self._store_cached_detection(sig, config)
+        return config
     
-    async def _calculate_rule_score(self, path: Path, rule: Dict[str, Any]) -> float:
+    async def _calculate_rule_score(self, path: Path, rule: Dict[str, Any],
+                                    entries: Dict[str, Tuple[bool, bool]],
+                                    file_cache: Dict[str, asyncio.Future],
+                                    stat_cache: Dict[str, Tuple[bool, bool]]) -> float:
         """Calculate score for a detection rule"""
-        patterns = rule.get('patterns', [])
-        weight = rule.get('weight', 1.0)
+        weight = rule['weight']
         
         matches = 0
         required_matches = 0
-        total_patterns = len(patterns)
-        required_patterns = sum(1 for p in patterns if p.get('required', False))
-        
-        for pattern in patterns:
-            pattern_path = path / pattern['path']
-            pattern_type = pattern['type']
-            is_required = pattern.get('required', False)
-            regex_pattern = pattern.get('regex')
-            content_pattern = pattern.get('content')
+        total_patterns = rule['pattern_count']
+        required_patterns = rule['required_count']
+        root = str(path)
+        
+        for rel_path, pattern_type, is_required, regex_pattern, content_pattern in rule['checks']:
+            pattern_path = os.path.join(root, rel_path)
+            name = rel_path.rstrip('/')
+            if '/' in name:
+                is_file, is_dir = self._stat_path(pattern_path, stat_cache)
+            else:
+                is_file, is_dir = entries.get(name, (False, False))
             
             if pattern_type == 'file':
-                if pattern_path.is_file():
+                if is_file:
                     match = True
                     
-                    # Check regex pattern in file content
-                    if regex_pattern:
-                        try:
-                            with open(pattern_path, 'r', encoding='utf-8') as f:
-                                content = f.read()
-                                if not re.search(regex_pattern, content):
-                                    match = False
-                        except Exception:
+                    # Check regex and content patterns against the (shared) file content
+                    if regex_pattern or content_pattern:
+                        content = await self._read_file_cached(pattern_path, file_cache)
+                        if content is None:
                             match = False
-                    
-                    # Check content pattern
-                    if content_pattern:
-                        try:
-                            with open(pattern_path, 'r', encoding='utf-8') as f:
-                                content = f.read()
-                                if not re.search(content_pattern, content):
-                                    match = False
-                        except Exception:
+                        elif regex_pattern and not regex_pattern.search(content):
+                            match = False
+                        elif content_pattern and not content_pattern.search(content):
                             match = False
                     
                     if match:
@@ -372,7 +565,7 @@ class ProjectDetector:
                         return 0.0  # Required file missing
                         
             elif pattern_type == 'directory':
-                if pattern_path.is_dir():
+                if is_dir:
                     matches += 1
                     if is_required:
                         required_matches += 1
@@ -390,22 +583,82 @@ class ProjectDetector:
         base_score = matches / total_patterns
         return base_score * weight
     
-    async def _detect_project_phase(self, path: Path) -> ProjectPhase:
-        """Detect current project phase"""
+    def _scan_entries(self, path: Path, stat_cache: Dict[str, Tuple[bool, bool]]) -> Tuple[Dict[str, Tuple[bool, bool]], bytes]:
+        """Map each top-level entry name to (is_file, is_dir) and fingerprint them and the nested probes"""
+        entries = {}
+        stamps = []
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    entries[entry.name] = (entry.is_file(), entry.is_dir())
+                    try:
+                        st = entry.stat()
+                        stamps.append(f'{entry.name}:{st.st_mtime_ns}:{st.st_size}')
+                    except OSError:
+                        stamps.append(f'{entry.name}:-')
+        except OSError:
+            pass
+        stamps.sort()
+        
+        # Nested probe files change without touching the top-level entries; their stats also seed stat_cache
+        root = str(path)
+        for rel_path in self.nested_probes:
+            probe_path = os.path.join(root, rel_path)
+            try:
+                st = os.stat(probe_path)
+            except OSError:
+                stat_cache[probe_path] = (False, False)
+                stamps.append(f'{rel_path}:-')
+                continue
+            stat_cache[probe_path] = (stat.S_ISREG(st.st_mode), stat.S_ISDIR(st.st_mode))
+            stamps.append(f'{rel_path}:{st.st_mtime_ns}:{st.st_size}')
+        sig = hashlib.blake2b('\n'.join(stamps).encode(), digest_size=16).digest()
+        return entries, sig
+    
+    def _stat_path(self, path: str, stat_cache: Dict[str, Tuple[bool, bool]]) -> Tuple[bool, bool]:
+        """Return (is_file, is_dir) for a path using one cached stat() call"""
+        kind = stat_cache.get(path)
+        if kind is None:
+            try:
+                mode = os.stat(path).st_mode
+                kind = (stat.S_ISREG(mode), stat.S_ISDIR(mode))
+            except OSError:
+                kind = (False, False)
+            stat_cache[path] = kind
+        return kind
+    
+    async def _read_file_cached(self, file_path: str, file_cache: Dict[str, asyncio.Future]) -> Optional[str]:
+        """Read a file once per detection pass, sharing the result between rules"""
+        if file_path not in file_cache:
+            file_cache[file_path] = asyncio.ensure_future(self._read_file(file_path))
+        return await file_cache[file_path]
+    
+    async def _read_file(self, file_path: str) -> Optional[str]:
+        """Read a text file, returning None if it cannot be read"""
+        try:
+            async with aiofiles.open(file_path, 'r', encoding='utf-8') as f:
+                return await f.read()
+        except Exception:
+            return None
+    
+    async def _detect_project_phase(self, path: Path, entries: Dict[str, Tuple[bool, bool]]) -> ProjectPhase:
+        """Detect current project phase from the top-level directory entries"""
         # Check for deployment indicators
-        if any((path / f).exists() for f in ['Dockerfile', 'docker-compose.yml', '.github/workflows', 'vercel.json']):
+        if any(n in entries for n in ('Dockerfile', 'docker-compose.yml', 'vercel.json')):
+            return ProjectPhase.DEPLOYMENT
+        if entries.get('.github', (False, False))[1] and (path / '.github' / 'workflows').exists():
             return ProjectPhase.DEPLOYMENT
             
         # Check for testing indicators
-        if any((path / f).exists() for f in ['tests/', 'test/', '__tests__', 'cypress/', 'playwright.config.js']):
+        if any(n in entries for n in ('tests', 'test', '__tests__', 'cypress', 'playwright.config.js')):
             return ProjectPhase.TESTING
             
         # Check for development indicators
-        if any((path / f).exists() for f in ['src/', 'app/', 'pages/', 'components/']):
+        if any(n in entries for n in ('src', 'app', 'pages', 'components')):
             return ProjectPhase.DEVELOPMENT
             
         # Check for planning indicators
-        if any((path / f).exists() for f in ['README.md', 'PLANNING.md', 'ROADMAP.md', 'docs/']):
+        if any(n in entries for n in ('README.md', 'PLANNING.md', 'ROADMAP.md', 'docs')):
             return ProjectPhase.PLANNING
             
         return ProjectPhase.DEVELOPMENT
@@ -417,8 +670,8 @@ class ProjectDetector:
             return None
             
         try:
-            with open(claude_file, 'r', encoding='utf-8') as f:
-                content = f.read()
+            async with aiofiles.open(claude_file, 'r', encoding='utf-8') as f:
+                content = await f.read()
                 
             # Parse CLAUDE.md (simplified parser)
             config = self._parse_claude_md(content)
@@ -444,7 +697,7 @@ class ProjectDetector:
             if end_idx != -1:
                 yaml_content = content[4:end_idx]
                 try:
-                    yaml_config = yaml.safe_load(yaml_content)
+                    yaml_config = yaml.load(yaml_content, Loader=SafeLoader)
                     config.update(yaml_config)
                 except Exception as e:
                     logger.warning(f"Failed to parse YAML frontmatter: {e}")
@@ -454,9 +707,20 @@ class ProjectDetector:
 class ClaudeConfigHandler:
     """Handle CLAUDE.md detection and workflow activation"""
     
+    # One pass over CLAUDE.md: "## section", "### workflow" and "key: value" lines
+    _CLAUDE_MD_LINE_RE = re.compile(
+        r'^[ \t]*(?:'
+        r'###[ \t]+(?P<workflow>[^\n]*?)'
+        r'|##[ \t]+(?P<section>[^\n]*?)'
+        r'|(?P<key>[^:#\s][^:\n]*):(?P<value>[^\n]*)'
+        r')[ \t]*\r?$',
+        re.MULTILINE
+    )
+    
     def __init__(self, orchestrator):
         self.orchestrator = orchestrator
         self.active_configs = {}
+        self.parsed_configs: Dict[str, Tuple[bytes, Dict[str, Any]]] = {}
         
     async def scan_directory(self, directory: str) -> Optional[Dict[str, Any]]:
         """Scan directory for CLAUDE.md and activate if found"""
@@ -478,11 +742,19 @@ class ClaudeConfigHandler:
     async def _load_claude_config(self, claude_path: Path) -> Optional[Dict[str, Any]]:
         """Load and parse CLAUDE.md configuration"""
         try:
-            with open(claude_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            async with aiofiles.open(claude_path, 'r', encoding='utf-8') as f:
+                content = await f.read()
+            
+            # Skip re-parsing when the file content is unchanged since the last load
+            key = str(claude_path)
+            digest = hashlib.blake2b(content.encode(), digest_size=16).digest()
+            cached = self.parsed_configs.get(key)
+            if cached and cached[0] == digest:
+                return cached[1]
                 
             # Parse the configuration
             config = self._parse_claude_md_advanced(content)
+            self.parsed_configs[key] = (digest, config)
             return config
         except Exception as e:
             logger.error(f"Failed to load CLAUDE.md: {e}")
@@ -499,38 +771,34 @@ class ClaudeConfigHandler:
             'tools': []
         }
         
-        lines = content.split('\n')
         current_section = None
         current_workflow = None
         
-        for line in lines:
-            line = line.strip()
+        # Only headers and "key: value" lines match; blank lines and comments are skipped
+        for match in self._CLAUDE_MD_LINE_RE.finditer(content):
+            section, workflow_name, key = match.group('section', 'workflow', 'key')
             
-            # Skip empty lines and comments
-            if not line or line.startswith('#'):
-                continue
-                
             # Section headers
-            if line.startswith('## '):
-                current_section = line[3:].lower().replace(' ', '_')
+            if section is not None:
+                current_section = section.lower().replace(' ', '_')
                 continue
                 
             # Workflow definitions
-            if line.startswith('### ') and current_section == 'workflows':
-                current_workflow = {
-                    'name': line[4:],
-                    'triggers': [],
-                    'actions': [],
-                    'conditions': []
-                }
-                config['workflows'].append(current_workflow)
+            if workflow_name is not None:
+                if current_section == 'workflows':
+                    current_workflow = {
+                        'name': workflow_name,
+                        'triggers': [],
+                        'actions': [],
+                        'conditions': []
+                    }
+                    config['workflows'].append(current_workflow)
                 continue
                 
             # Configuration items
-            if ':' in line and current_section:
-                key, value = line.split(':', 1)
+            if current_section:
                 key = key.strip()
-                value = value.strip()
+                value = match.group('value').strip()
                 
                 if current_section == 'project':
                     config['project'][key] = value
@@ -684,13 +952,18 @@ class ToolIntegrator:
         command = tool_config.get('command')
         if command:
             try:
-                result = subprocess.run(['which', command], capture_output=True, text=True)
-                if result.returncode != 0:
+                if self._resolve_command(command) is None:
                     # Try to install or setup tool
                     await self._setup_tool(tool_name, tool_config)
             except Exception as e:
                 logger.warning(f"Tool verification failed for {tool_name}: {e}")
     
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _resolve_command(command: str) -> Optional[str]:
+        """Resolve a command on PATH once per process"""
+        return shutil.which(command)
+    
     async def _integrate_mcp_tool(self, tool_name: str, tool_config: Dict[str, Any], config: Dict[str, Any]) -> None:
         """Integrate MCP-based tool"""
         # MCP tools are integrated through Claude Code
@@ -707,11 +980,13 @@ class ToolIntegrator:
         if tool_name in setup_scripts:
             script_path = setup_scripts[tool_name]
             if os.path.exists(script_path):
-                try:
-                    subprocess.run(['bash', script_path], check=True)
+                process = await asyncio.create_subprocess_exec('bash', script_path)
+                returncode = await process.wait()
+                if returncode == 0:
+                    self._resolve_command.cache_clear()
                     logger.info(f"Successfully setup tool: {tool_name}")
-                except subprocess.CalledProcessError as e:
-                    logger.error(f"Failed to setup tool {tool_name}: {e}")
+                else:
+                    logger.error(f"Failed to setup tool {tool_name}: {script_path} returned non-zero exit status {returncode}")
     
     async def execute_tool_command(self, tool_name: str, command: str, args: List[str] = None) -> Dict[str, Any]:
         """Execute a command using a specific tool"""
@@ -737,14 +1012,25 @@ class ToolIntegrator:
         cmd = [tool_config['command']] + args
         
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
+            process = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
+        except Exception as e:
+            return {'success': False, 'error': str(e)}
+        
+        try:
+            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=300)
             return {
-                'success': result.returncode == 0,
-                'stdout': result.stdout,
-                'stderr': result.stderr,
-                'returncode': result.returncode
+                'success': process.returncode == 0,
+                'stdout': stdout.decode(errors='replace'),
+                'stderr': stderr.decode(errors='replace'),
+                'returncode': process.returncode
             }
-        except subprocess.TimeoutExpired:
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
             return {'success': False, 'error': 'Command timeout'}
         except Exception as e:
             return {'success': False, 'error': str(e)}
@@ -755,52 +1041,9 @@ class ToolIntegrator:
         # For now, return mock response
         return {'success': True, 'result': 'MCP command executed'}
 
-class AgentManager:
-    """Multi-agent orchestration and coordination"""
-    
-    def __init__(self, orchestrator):
-        self.orchestrator = orchestrator
-        self.agents = {}
-        self.agent_configs = {}
-        self.communication_hub = asyncio.Queue()
-        
-    async def create_agent(self, agent_config: AgentConfig) -> bool:
-        """Create a new agent"""
-        try:
-            # Create tmux session for agent
-            session_name = agent_config.session_name
-            window_name = agent_config.window_name
-            
-            # Create session if it doesn't exist
-            subprocess.run(['tmux', 'new-session', '-d', '-s', session_name], check=False)
-            
-            # Create or switch to window
-            subprocess.run(['tmux', 'new-window', '-t', session_name, '-n', window_name], check=False)
-            
-            # Start Claude in the window
-            subprocess.run(['tmux', 'send-keys', '-t', f'{session_name}:{window_name}', 'claude', 'Enter'], check=False)
-            
-            # Wait for Claude to start
-            await asyncio.sleep(5)
-            
-            # Send agent briefing
-            briefing = self._generate_agent_briefing(agent_config)
-            await self._send_agent_message(session_name, window_name, briefing)
-            
-            # Store agent configuration
-            self.agents[f"{session_name}:{window_name}"] = agent_config
-            
-            logger.info(f"Created agent: {agent_config.role.value} in {session_name}:{window_name}")
-            return True
-            
-        except Exception as e:
-            logger.error(f"Failed to create agent: {e}")
-            return False
-    
-    def _generate_agent_briefing(self, agent_config: AgentConfig) -> str:
-        """Generate agent briefing based on role"""
-        briefings = {
-            AgentRole.PROJECT_MANAGER: """
+# Role briefings are static, so build them once instead of on every agent creation
+_AGENT_BRIEFINGS: Dict[AgentRole, str] = {
+    AgentRole.PROJECT_MANAGER: """
 You are a Project Manager AI with focus on quality and coordination.
 
 RESPONSIBILITIES:
@@ -819,7 +1062,7 @@ TOOLS AVAILABLE:
 Use Claude Code for all development tasks and tool coordination.
 Commit to git every 30 minutes and maintain clear communication.
 """,
-            AgentRole.DEVELOPER: """
+    AgentRole.DEVELOPER: """
 You are a Senior Developer AI focused on implementation excellence.
 
 RESPONSIBILITIES:
@@ -839,7 +1082,7 @@ TOOLS AVAILABLE:
 Use Claude Code for all development tasks. Commit every 30 minutes.
 Focus on quality and maintainability over speed.
 """,
-            AgentRole.QA_ENGINEER: """
+    AgentRole.QA_ENGINEER: """
 You are a QA Engineer AI with comprehensive testing expertise.
 
 RESPONSIBILITIES:
@@ -859,7 +1102,7 @@ TOOLS AVAILABLE:
 Use Claude Code to orchestrate comprehensive automated testing.
 Never compromise on quality standards.
 """,
-            AgentRole.DEVOPS: """
+    AgentRole.DEVOPS: """
 You are a DevOps Engineer AI focused on infrastructure and deployment.
 
 RESPONSIBILITIES:
@@ -878,7 +1121,7 @@ TOOLS AVAILABLE:
 Use Claude Code for infrastructure management and automation.
 Focus on reliability, security, and performance optimization.
 """,
-            AgentRole.SECURITY: """
+    AgentRole.SECURITY: """
 You are a Security Engineer AI focused on comprehensive security.
 
 RESPONSIBILITIES:
@@ -896,7 +1139,7 @@ TOOLS AVAILABLE:
 Use Claude Code for security analysis and remediation.
 Never compromise on security standards.
 """,
-            AgentRole.RESEARCHER: """
+    AgentRole.RESEARCHER: """
 You are a Research AI focused on intelligence gathering and analysis.
 
 RESPONSIBILITIES:
@@ -915,79 +1158,282 @@ TOOLS AVAILABLE:
 Use Claude Code for research coordination and analysis.
 Focus on providing actionable intelligence and insights.
 """
-        }
+}
+
+_DEFAULT_BRIEFING = "You are an AI agent. Use Claude Code for all tasks."
+
+class AgentManager:
+    """Multi-agent orchestration and coordination"""
+    
+    def __init__(self, orchestrator):
+        self.orchestrator = orchestrator
+        self.agents = {}
+        self.agent_configs = {}
+        # Bounded message hub: the oldest messages are dropped once 4096 are pending
+        self._hub_buffer = deque(maxlen=4096)
+        self._hub_event = asyncio.Event()
+        # One long-lived tmux control-mode client carries every agent message
+        self._tmux_ctl: Optional[asyncio.subprocess.Process] = None
+        self._tmux_lock = asyncio.Lock()
+        # At most this many task dispatches run at once; slowest observed dispatch per agent
+        self.max_concurrent_dispatches = 4
+        self._dispatch_semaphore = asyncio.Semaphore(self.max_concurrent_dispatches)
+        self._dispatch_max_seconds: Dict[str, float] = {}
         
-        return briefings.get(agent_config.role, "You are an AI agent. Use Claude Code for all tasks.")
+    async def create_agent(self, agent_config: AgentConfig) -> bool:
+        """Create a new agent"""
+        try:
+            # Create tmux session for agent; interned names make agent-id lookups identity hits
+            session_name = agent_config.session_name = sys.intern(agent_config.session_name)
+            window_name = agent_config.window_name = sys.intern(agent_config.window_name)
+            
+            # Create session if it doesn't exist
+            await self.ensure_session(session_name)
+            
+            # Create the window and start Claude in it with one chained tmux command
+            await self._run_tmux(
+                'new-window', '-t', session_name, '-n', window_name, ';',
+                'send-keys', '-t', f'{session_name}:{window_name}', 'claude', 'Enter'
+            )
+            
+            # Wait for Claude to start
+            await asyncio.sleep(5)
+            
+            # Send agent briefing
+            briefing = self._generate_agent_briefing(agent_config)
+            await self._send_agent_message(session_name, window_name, briefing)
+            
+            # Store agent configuration
+            self.agents[sys.intern(f"{session_name}:{window_name}")] = agent_config
+            
+            logger.info(f"Created agent: {agent_config.role.value} in {session_name}:{window_name}")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Failed to create agent: {e}")
+            return False
+    
+    async def ensure_session(self, session_name: str) -> None:
+        """Create a detached tmux session (fails harmlessly when it already exists)"""
+        await self._run_tmux('new-session', '-d', '-s', session_name)
+    
+    def publish_message(self, message: Dict[str, Any]) -> None:
+        """Publish a message on the agent communication hub"""
+        self._hub_buffer.append(message)
+        self._hub_event.set()
+    
+    async def iter_messages(self) -> AsyncIterator[Dict[str, Any]]:
+        """Yield hub messages as they are published"""
+        while True:
+            await self._hub_event.wait()
+            self._hub_event.clear()
+            while self._hub_buffer:
+                yield self._hub_buffer.popleft()
+    
+    async def _run_tmux(self, *args: str) -> Tuple[int, str]:
+        """Run a tmux command without blocking the event loop"""
+        process = await asyncio.create_subprocess_exec(
+            'tmux', *args,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL
+        )
+        stdout, _ = await process.communicate()
+        return process.returncode, stdout.decode(errors='replace')
+    
+    def _generate_agent_briefing(self, agent_config: AgentConfig) -> str:
+        """Generate agent briefing based on role"""
+        return _AGENT_BRIEFINGS.get(agent_config.role, _DEFAULT_BRIEFING)
+    
+    @staticmethod
+    def _tmux_quote(text: str) -> str:
+        """Quote text as a single tmux argument that fits on one control-mode line"""
+        escaped = (text.replace('\\', '\\\\').replace('"', '\\"').replace('$', '\\$')
+                   .replace('\n', '\\n').replace('\r', '\\r'))
+        return f'"{escaped}"'
+    
+    async def _send_tmux_commands(self, session_name: str, *commands: str) -> None:
+        """Write commands to the tmux control-mode client, starting it if needed"""
+        async with self._tmux_lock:
+            if self._tmux_ctl is None or self._tmux_ctl.returncode is not None:
+                self._tmux_ctl = await asyncio.create_subprocess_exec(
+                    'tmux', '-C', 'attach-session', '-t', session_name,
+                    stdin=asyncio.subprocess.PIPE,
+                    stdout=asyncio.subprocess.DEVNULL,
+                    stderr=asyncio.subprocess.DEVNULL
+                )
+            self._tmux_ctl.stdin.write(''.join(f'{command}\n' for command in commands).encode())
+            await self._tmux_ctl.stdin.drain()
     
     async def _send_agent_message(self, session_name: str, window_name: str, message: str) -> None:
         """Send message to an agent"""
-        script_path = "/mnt/c/ai-development-ecosystem/autonomous-claude-system/Tmux-Orchestrator/send-claude-message.sh"
-        target = f"{session_name}:{window_name}"
+        target = self._tmux_quote(f"{session_name}:{window_name}")
         
         try:
-            subprocess.run([script_path, target, message], check=True)
-        except subprocess.CalledProcessError as e:
+            await self._send_tmux_commands(session_name, f'send-keys -t {target} -l {self._tmux_quote(message)}')
+            # Let the Claude prompt take the typed text before submitting it
+            await asyncio.sleep(0.5)
+            await self._send_tmux_commands(session_name, f'send-keys -t {target} Enter')
+        except OSError as e:
+            self._tmux_ctl = None
             logger.error(f"Failed to send message to agent: {e}")
     
     async def coordinate_agents(self, task: str, agents: List[str]) -> Dict[str, Any]:
         """Coordinate multiple agents for a task"""
-        results = {}
+        task_message = f"TASK: {task}\n\nPlease complete this task according to your role and report back with results."
+        targets = [agent_id for agent_id in agents if agent_id in self.agents]
+        # Start historically fast agents first so they do not queue behind slow ones
+        dispatch_order = sorted(targets, key=lambda agent_id: self._dispatch_max_seconds.get(agent_id, 0.0))
         
-        for agent_id in agents:
-            if agent_id in self.agents:
-                agent_config = self.agents[agent_id]
-                session_name, window_name = agent_id.split(':')
-                
-                # Send task to agent
-                task_message = f"TASK: {task}\n\nPlease complete this task according to your role and report back with results."
-                await self._send_agent_message(session_name, window_name, task_message)
-                
-                # Store task assignment
-                results[agent_id] = {
-                    'task': task,
-                    'status': 'assigned',
-                    'timestamp': datetime.now().isoformat()
-                }
+        # Store task assignments, then send the task to every agent concurrently
+        timestamp = datetime.now().isoformat()
+        results = {
+            agent_id: {'task': task, 'status': 'assigned', 'timestamp': timestamp}
+            for agent_id in targets
+        }
+        outcomes = await asyncio.gather(*[
+            self._dispatch(agent_id, task_message) for agent_id in dispatch_order
+        ], return_exceptions=True)
+        
+        for agent_id, outcome in zip(dispatch_order, outcomes):
+            if isinstance(outcome, Exception):
+                logger.error(f"Failed to dispatch task to agent {agent_id}: {outcome}")
         
         return results
     
+    async def _dispatch(self, agent_id: str, message: str) -> None:
+        """Send a message to an agent within the dispatch concurrency limit"""
+        agent_config = self.agents[agent_id]
+        async with self._dispatch_semaphore:
+            started = time.monotonic()
+            await self._send_agent_message(agent_config.session_name, agent_config.window_name, message)
+            elapsed = time.monotonic() - started
+        if elapsed > self._dispatch_max_seconds.get(agent_id, 0.0):
+            self._dispatch_max_seconds[agent_id] = elapsed
+    
     async def monitor_agents(self) -> Dict[str, Any]:
         """Monitor agent status and health"""
         status = {}
         
+        # One tmux call lists every live session instead of a has-session per agent
+        try:
+            code, output = await self._run_tmux('list-sessions', '-F', '#{session_name}')
+            live_sessions = set(output.splitlines()) if code == 0 else set()
+        except OSError as e:
+            return {
+                agent_id: {'role': agent_config.role.value, 'error': str(e), 'active': False}
+                for agent_id, agent_config in self.agents.items()
+            }
+        
+        # Capture the windows of live agents concurrently
+        live_agents = [
+            agent_id for agent_id, agent_config in self.agents.items()
+            if agent_config.session_name in live_sessions
+        ]
+        captures = await asyncio.gather(*[
+            self._run_tmux('capture-pane', '-t', agent_id, '-p') for agent_id in live_agents
+        ], return_exceptions=True)
+        captured = dict(zip(live_agents, captures))
+        
         for agent_id, agent_config in self.agents.items():
-            session_name, window_name = agent_id.split(':')
-            
-            try:
-                # Check if tmux session exists
-                result = subprocess.run(['tmux', 'has-session', '-t', session_name], capture_output=True)
-                session_exists = result.returncode == 0
-                
-                # Get window content
-                if session_exists:
-                    result = subprocess.run(['tmux', 'capture-pane', '-t', f'{session_name}:{window_name}', '-p'], 
-                                         capture_output=True, text=True)
-                    window_content = result.stdout if result.returncode == 0 else ""
-                else:
-                    window_content = ""
-                
+            capture = captured.get(agent_id, (1, ''))
+            if isinstance(capture, Exception):
                 status[agent_id] = {
                     'role': agent_config.role.value,
-                    'session_exists': session_exists,
-                    'active': session_exists,
-                    'last_activity': datetime.now().isoformat(),
-                    'window_content_length': len(window_content)
-                }
-                
-            except Exception as e:
-                status[agent_id] = {
-                    'role': agent_config.role.value,
-                    'error': str(e),
+                    'error': str(capture),
                     'active': False
                 }
+                continue
+            
+            session_exists = agent_id in captured
+            code, window_content = capture
+            status[agent_id] = {
+                'role': agent_config.role.value,
+                'session_exists': session_exists,
+                'active': session_exists,
+                'last_activity': datetime.now().isoformat(),
+                'window_content_length': len(window_content) if code == 0 else 0
+            }
         
         return status
 
+# Common vulnerability patterns, compiled once as bytes patterns to scan mapped files directly
+_VULNERABILITY_PATTERNS = tuple(
+    (vuln_type, re.compile(pattern.encode(), re.IGNORECASE))
+    for vuln_type, pattern in {
+        'sql_injection': r'(SELECT|INSERT|UPDATE|DELETE).*\+.*\$',
+        'xss': r'innerHTML\s*=\s*.*\+',
+        'hardcoded_secrets': r'(password|api_key|secret)\s*=\s*["\'][^"\']+["\']',
+        'unsafe_eval': r'eval\s*\(',
+        'unsafe_exec': r'exec\s*\(',
+    }.items()
+)
+# Fused alternation of all patterns: one pass rejects files that match none of them
+_VULNERABILITY_PREFILTER = re.compile(
+    b'|'.join(b'(?:' + regex.pattern + b')' for _, regex in _VULNERABILITY_PATTERNS), re.IGNORECASE
+)
+# Configuration files that should never be committed, in reporting order
+_SENSITIVE_FILES = ('.env', '.env.local', '.env.production', 'config.json', 'secrets.json')
+_SENSITIVE_FILE_SET = frozenset(_SENSITIVE_FILES)
+_SOURCE_EXTENSIONS = ('.js', '.ts', '.py', '.java', '.php', '.rb')
+
+def _iter_source_files(root: str) -> Iterator[str]:
+    """Yield source file paths under root in os.walk order using an explicit scandir stack"""
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        
+        subdirs = []
+        for entry in entries:
+            # d_type answers both checks without a stat; only symlinks with a source name get followed
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+            elif entry.name.endswith(_SOURCE_EXTENSIONS) and not entry.is_dir():
+                # Like os.walk, a symlinked directory is neither descended into nor scanned
+                yield entry.path
+        stack.extend(reversed(subdirs))
+
+def _scan_source_file(file_path: str) -> List[Tuple[str, int]]:
+    """Return (vulnerability type, line number) findings for one memory-mapped source file"""
+    findings = []
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return findings
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if not _VULNERABILITY_PREFILTER.search(mm):
+                return findings
+            
+            matches = [
+                (vuln_type, match.start())
+                for vuln_type, regex in _VULNERABILITY_PATTERNS
+                for match in regex.finditer(mm)
+            ]
+            
+            # Resolve every match offset to a line number in one forward sweep over the file
+            line_of = {}
+            line_num, pos = 1, 0
+            for offset in sorted({offset for _, offset in matches}):
+                line_num += mm[pos:offset].count(b'\n')
+                pos = offset
+                line_of[offset] = line_num
+            
+            findings = [(vuln_type, line_of[offset]) for vuln_type, offset in matches]
+    return findings
+
+def _scan_source_files(file_paths: List[str]) -> List[Tuple[str, List[Tuple[str, int]], Optional[str]]]:
+    """Scan a batch of files in a worker process, returning (path, findings, error) per file"""
+    scanned = []
+    for file_path in file_paths:
+        try:
+            scanned.append((file_path, _scan_source_file(file_path), None))
+        except Exception as e:
+            scanned.append((file_path, [], str(e)))
+    return scanned
+
 class SecurityManager:
     """Security implementation and monitoring"""
     
@@ -995,7 +1441,16 @@ class SecurityManager:
         self.orchestrator = orchestrator
         self.security_policies = {}
         self.threat_detection = {}
-        self.audit_log = []
+        self.audit_log = deque(maxlen=1024)
+        # Worker pool for CPU-bound regex scanning, created on first use
+        self.scan_executor: Optional[ProcessPoolExecutor] = None
+        self.scan_batch_size = 64
+        
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the scan worker pool, if one was started"""
+        if self.scan_executor is not None:
+            self.scan_executor.shutdown(wait=wait, cancel_futures=True)
+            self.scan_executor = None
         
     async def scan_vulnerabilities(self, project_path: str) -> Dict[str, Any]:
         """Scan project for security vulnerabilities"""
@@ -1015,19 +1470,37 @@ class SecurityManager:
     
     async def _scan_dependency_vulnerabilities(self, project_path: str, results: Dict[str, Any]) -> None:
         """Scan for dependency vulnerabilities"""
-        # Check package.json for npm vulnerabilities
+        # Run the npm and Python audits concurrently, keeping npm findings first
+        findings = await asyncio.gather(
+            self._scan_npm_vulnerabilities(project_path),
+            self._scan_python_vulnerabilities(project_path)
+        )
+        for vulnerabilities in findings:
+            results['vulnerabilities'].extend(vulnerabilities)
+    
+    async def _run_audit(self, cmd: List[str], cwd: str) -> Tuple[int, bytes]:
+        """Run an audit tool without blocking the event loop"""
+        process = await asyncio.create_subprocess_exec(
+            *cmd, cwd=cwd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL
+        )
+        stdout, _ = await process.communicate()
+        return process.returncode, stdout
+    
+    async def _scan_npm_vulnerabilities(self, project_path: str) -> List[Dict[str, Any]]:
+        """Check package.json for npm vulnerabilities"""
+        vulnerabilities = []
         package_json = Path(project_path) / 'package.json'
         if package_json.exists():
             try:
                 # Run npm audit
-                result = subprocess.run(['npm', 'audit', '--json'], 
-                                      cwd=project_path, capture_output=True, text=True)
-                if result.returncode != 0:
-                    audit_data = json.loads(result.stdout)
-                    vulnerabilities = audit_data.get('vulnerabilities', {})
+                returncode, stdout = await self._run_audit(['npm', 'audit', '--json'], project_path)
+                if returncode != 0:
+                    audit_data = orjson.loads(stdout)
                     
-                    for vuln_name, vuln_data in vulnerabilities.items():
-                        results['vulnerabilities'].append({
+                    for vuln_name, vuln_data in audit_data.get('vulnerabilities', {}).items():
+                        vulnerabilities.append({
                             'type': 'dependency',
                             'name': vuln_name,
                             'severity': vuln_data.get('severity', 'unknown'),
@@ -1036,19 +1509,21 @@ class SecurityManager:
                         })
             except Exception as e:
                 logger.warning(f"Dependency scan failed: {e}")
-        
-        # Check requirements.txt for Python vulnerabilities
+        return vulnerabilities
+    
+    async def _scan_python_vulnerabilities(self, project_path: str) -> List[Dict[str, Any]]:
+        """Check requirements.txt for Python vulnerabilities"""
+        vulnerabilities = []
         requirements_txt = Path(project_path) / 'requirements.txt'
         if requirements_txt.exists():
             try:
                 # Run safety check
-                result = subprocess.run(['safety', 'check', '--json'], 
-                                      cwd=project_path, capture_output=True, text=True)
-                if result.returncode != 0:
-                    safety_data = json.loads(result.stdout)
+                returncode, stdout = await self._run_audit(['safety', 'check', '--json'], project_path)
+                if returncode != 0:
+                    safety_data = orjson.loads(stdout)
                     
                     for vuln in safety_data:
-                        results['vulnerabilities'].append({
+                        vulnerabilities.append({
                             'type': 'dependency',
                             'name': vuln.get('package', 'unknown'),
                             'severity': 'high',
@@ -1057,50 +1532,60 @@ class SecurityManager:
                         })
             except Exception as e:
                 logger.warning(f"Python dependency scan failed: {e}")
+        return vulnerabilities
     
     async def _scan_code_vulnerabilities(self, project_path: str, results: Dict[str, Any]) -> None:
         """Scan for code vulnerabilities"""
-        # Common vulnerability patterns
-        patterns = {
-            'sql_injection': r'(SELECT|INSERT|UPDATE|DELETE).*\+.*\$',
-            'xss': r'innerHTML\s*=\s*.*\+',
-            'hardcoded_secrets': r'(password|api_key|secret)\s*=\s*["\'][^"\']+["\']',
-            'unsafe_eval': r'eval\s*\(',
-            'unsafe_exec': r'exec\s*\(',
-        }
+        file_paths = await asyncio.to_thread(list, _iter_source_files(project_path))
+        if not file_paths:
+            return
         
-        for root, dirs, files in os.walk(project_path):
-            for file in files:
-                if file.endswith(('.js', '.ts', '.py', '.java', '.php', '.rb')):
-                    file_path = os.path.join(root, file)
-                    try:
-                        with open(file_path, 'r', encoding='utf-8') as f:
-                            content = f.read()
-                            
-                        for vuln_type, pattern in patterns.items():
-                            matches = re.finditer(pattern, content, re.IGNORECASE)
-                            for match in matches:
-                                line_num = content[:match.start()].count('\n') + 1
-                                results['vulnerabilities'].append({
-                                    'type': 'code',
-                                    'vulnerability': vuln_type,
-                                    'file': file_path,
-                                    'line': line_num,
-                                    'severity': 'high',
-                                    'description': f"Potential {vuln_type} vulnerability",
-                                    'recommendation': f"Review and secure {vuln_type} usage"
-                                })
-                    except Exception as e:
-                        logger.warning(f"Code scan failed for {file_path}: {e}")
+        # Scan batches of files across CPU cores; gather keeps them in walk order
+        if self.scan_executor is None:
+            self.scan_executor = ProcessPoolExecutor(max_workers=os.cpu_count())
+        loop = asyncio.get_running_loop()
+        batches = [file_paths[i:i + self.scan_batch_size] for i in range(0, len(file_paths), self.scan_batch_size)]
+        try:
+            scanned_batches = await asyncio.gather(*[
+                loop.run_in_executor(self.scan_executor, _scan_source_files, batch) for batch in batches
+            ])
+        except Exception as e:
+            # A broken pool or an unpicklable worker falls back to scanning in a thread
+            logger.warning(f"Parallel code scan unavailable, scanning in-process: {e}")
+            self.shutdown(wait=False)
+            scanned_batches = [await asyncio.to_thread(_scan_source_files, file_paths)]
+        
+        for file_path, findings, error in (item for batch in scanned_batches for item in batch):
+            if error is not None:
+                logger.warning(f"Code scan failed for {file_path}: {error}")
+                continue
+            
+            for vuln_type, line_num in findings:
+                results['vulnerabilities'].append({
+                    'type': 'code',
+                    'vulnerability': vuln_type,
+                    'file': file_path,
+                    'line': line_num,
+                    'severity': 'high',
+                    'description': f"Potential {vuln_type} vulnerability",
+                    'recommendation': f"Review and secure {vuln_type} usage"
+                })
     
     async def _scan_configuration_vulnerabilities(self, project_path: str, results: Dict[str, Any]) -> None:
         """Scan for configuration vulnerabilities"""
-        # Check for exposed sensitive files
-        sensitive_files = ['.env', '.env.local', '.env.production', 'config.json', 'secrets.json']
+        # One directory read finds which sensitive files exist (broken symlinks do not count)
+        try:
+            with os.scandir(project_path) as it:
+                present = {
+                    entry.name for entry in it
+                    if entry.name in _SENSITIVE_FILE_SET and (not entry.is_symlink() or os.path.exists(entry.path))
+                }
+        except OSError:
+            return
         
-        for file_name in sensitive_files:
-            file_path = Path(project_path) / file_name
-            if file_path.exists():
+        for file_name in _SENSITIVE_FILES:
+            if file_name in present:
+                file_path = Path(project_path) / file_name
                 results['vulnerabilities'].append({
                     'type': 'configuration',
                     'file': str(file_path),
@@ -1153,19 +1638,17 @@ class SecurityManager:
             # Read existing .gitignore
             existing_content = ""
             if gitignore_path.exists():
-                with open(gitignore_path, 'r') as f:
-                    existing_content = f.read()
+                async with aiofiles.open(gitignore_path, 'r') as f:
+                    existing_content = await f.read()
             
-            # Add security entries if not present
-            needs_update = False
-            for entry in security_entries:
-                if entry not in existing_content:
-                    needs_update = True
-                    break
+            # Append only the security entries that are not already present as lines
+            existing_lines = {line.strip() for line in existing_content.splitlines()}
+            missing = [entry for entry in security_entries if entry and entry not in existing_lines]
             
-            if needs_update:
-                with open(gitignore_path, 'a') as f:
-                    f.write('\n'.join(security_entries))
+            if missing:
+                separator = '\n' if existing_content and not existing_content.endswith('\n') else ''
+                async with aiofiles.open(gitignore_path, 'a') as f:
+                    await f.write(separator + '\n'.join(missing) + '\n')
                 
                 measures['implemented'].append({
                     'measure': 'gitignore_security',
@@ -1193,78 +1676,103 @@ class MonitoringSystem:
     def __init__(self, orchestrator):
         self.orchestrator = orchestrator
         self.metrics = {}
-        self.alerts = []
+        self.history = MetricsBuffer()
+        self.alerts = deque(maxlen=1024)
+        # Monotonic raise time of each entry in alerts, kept alongside so alerts stay plain payloads
+        self._alert_times = deque(maxlen=1024)
         self.health_checks = {}
+        # Repeats of the same (type, severity) alert are suppressed for alert_cooldown seconds
+        self.alert_cooldown = 60
+        self._last_alert_ts: Dict[Tuple[str, str], float] = {}
+        # Disk usage moves slowly, so the statvfs result is reused for a few minutes
+        self.disk_cache_ttl = 300
+        self._disk_percent = 0.0
+        self._disk_checked_at = None
+        self._monitor_task: Optional[asyncio.Task] = None
         
     async def start_monitoring(self) -> None:
         """Start monitoring system"""
-        # Start background monitoring tasks
-        asyncio.create_task(self._monitor_system_resources())
-        asyncio.create_task(self._monitor_agents())
-        asyncio.create_task(self._monitor_projects())
+        # Prime the CPU counter so later non-blocking reads cover the time since the previous one
+        psutil.cpu_percent(interval=None)
+        
+        # Start the background monitoring task
+        self._monitor_task = asyncio.create_task(self._monitor_loop())
+        
+    async def _monitor_loop(self) -> None:
+        """Run every monitoring check from one task, each on its own schedule"""
+        loop = asyncio.get_running_loop()
+        # (check, interval after success, delay after failure, label) in seconds
+        checks = (
+            (self._monitor_system_resources, 30, 60, 'System'),
+            (self._monitor_agents, 60, 60, 'Agent'),
+            (self._monitor_projects, 300, 300, 'Project'),
+        )
+        next_due = [0.0] * len(checks)
         
+        while True:
+            now = loop.time()
+            for i, (check, interval, retry_delay, label) in enumerate(checks):
+                if now < next_due[i]:
+                    continue
+                try:
+                    await check()
+                    next_due[i] = now + interval
+                except Exception as e:
+                    logger.error(f"{label} monitoring error: {e}")
+                    next_due[i] = now + retry_delay
+            
+            # Sleep until the earliest check is due again
+            await asyncio.sleep(max(0.0, min(next_due) - loop.time()))
+    
     async def _monitor_system_resources(self) -> None:
         """Monitor system resources"""
-        while True:
-            try:
-                # CPU usage
-                cpu_percent = psutil.cpu_percent(interval=1)
-                
-                # Memory usage
-                memory = psutil.virtual_memory()
-                memory_percent = memory.percent
-                
-                # Disk usage
-                disk = psutil.disk_usage('/')
-                disk_percent = (disk.used / disk.total) * 100
-                
-                # Network I/O
-                network = psutil.net_io_counters()
-                
-                # Store metrics
-                self.metrics['system'] = ResourceMetrics(
-                    cpu_percent=cpu_percent,
-                    memory_percent=memory_percent,
-                    disk_usage=disk_percent,
-                    network_io={
-                        'bytes_sent': network.bytes_sent,
-                        'bytes_recv': network.bytes_recv
-                    }
-                )
-                
-                # Check for alerts
-                await self._check_resource_alerts()
-                
-                await asyncio.sleep(30)  # Check every 30 seconds
-                
-            except Exception as e:
-                logger.error(f"System monitoring error: {e}")
-                await asyncio.sleep(60)
+        # CPU usage since the previous check, without sleeping the event loop
+        cpu_percent = psutil.cpu_percent(interval=None)
+        
+        # Memory usage
+        memory = psutil.virtual_memory()
+        memory_percent = memory.percent
+        
+        # Disk usage
+        disk_percent = self._get_disk_percent()
+        
+        # Network I/O
+        network = psutil.net_io_counters()
+        
+        # Store metrics
+        self.history.record(cpu_percent, memory_percent, disk_percent)
+        self.metrics['system'] = ResourceMetrics(
+            cpu_percent=cpu_percent,
+            memory_percent=memory_percent,
+            disk_usage=disk_percent,
+            network_io={
+                'bytes_sent': network.bytes_sent,
+                'bytes_recv': network.bytes_recv
+            }
+        )
+        
+        # Check for alerts
+        await self._check_resource_alerts()
+    
+    def _get_disk_percent(self) -> float:
+        """Root filesystem usage, refreshed at most once per disk_cache_ttl seconds"""
+        now = time.monotonic()
+        if self._disk_checked_at is None or now - self._disk_checked_at >= self.disk_cache_ttl:
+            disk = psutil.disk_usage('/')
+            self._disk_percent = (disk.used / disk.total) * 100
+            self._disk_checked_at = now
+        return self._disk_percent
     
     async def _monitor_agents(self) -> None:
         """Monitor agent health and performance"""
-        while True:
-            try:
-                if hasattr(self.orchestrator, 'agent_manager'):
-                    agent_status = await self.orchestrator.agent_manager.monitor_agents()
-                    self.metrics['agents'] = agent_status
-                
-                await asyncio.sleep(60)  # Check every minute
-                
-            except Exception as e:
-                logger.error(f"Agent monitoring error: {e}")
-                await asyncio.sleep(60)
+        if hasattr(self.orchestrator, 'agent_manager'):
+            agent_status = await self.orchestrator.agent_manager.monitor_agents()
+            self.metrics['agents'] = agent_status
     
     async def _monitor_projects(self) -> None:
         """Monitor project health"""
-        while True:
-            try:
-                # This would implement project monitoring
-                await asyncio.sleep(300)  # Check every 5 minutes
-                
-            except Exception as e:
-                logger.error(f"Project monitoring error: {e}")
-                await asyncio.sleep(300)
+        # This would implement project monitoring
+        pass
     
     async def _check_resource_alerts(self) -> None:
         """Check for resource-based alerts"""
@@ -1274,23 +1782,28 @@ class MonitoringSystem:
         
         # CPU alert
         if system_metrics.cpu_percent > 80:
-            alert = {
-                'type': 'resource',
-                'severity': 'warning',
-                'message': f'High CPU usage: {system_metrics.cpu_percent}%',
-                'timestamp': datetime.now().isoformat()
-            }
-            self.alerts.append(alert)
+            self._raise_alert('resource', 'warning', f'High CPU usage: {system_metrics.cpu_percent}%')
         
         # Memory alert
         if system_metrics.memory_percent > 85:
-            alert = {
-                'type': 'resource',
-                'severity': 'critical',
-                'message': f'High memory usage: {system_metrics.memory_percent}%',
-                'timestamp': datetime.now().isoformat()
-            }
-            self.alerts.append(alert)
+            self._raise_alert('resource', 'critical', f'High memory usage: {system_metrics.memory_percent}%')
+    
+    def _raise_alert(self, alert_type: str, severity: str, message: str) -> None:
+        """Record an alert unless the same kind was raised within the cooldown window"""
+        now = time.monotonic()
+        key = (alert_type, severity)
+        last = self._last_alert_ts.get(key)
+        if last is not None and now - last < self.alert_cooldown:
+            return
+        
+        self._last_alert_ts[key] = now
+        self.alerts.append({
+            'type': alert_type,
+            'severity': severity,
+            'message': message,
+            'timestamp': datetime.now().isoformat()
+        })
+        self._alert_times.append(now)
     
     async def get_health_status(self) -> Dict[str, Any]:
         """Get overall system health status"""
@@ -1298,8 +1811,9 @@ class MonitoringSystem:
             'timestamp': datetime.now().isoformat(),
             'system_metrics': self.metrics.get('system').__dict__ if self.metrics.get('system') else {},
             'agent_metrics': self.metrics.get('agents', {}),
+            'metrics_window': self.history.summary(),
             'active_alerts': len(self.alerts),
-            'recent_alerts': self.alerts[-10:],  # Last 10 alerts
+            'recent_alerts': list(islice(reversed(self.alerts), 10))[::-1],  # Last 10 alerts
             'health_score': await self._calculate_health_score()
         }
     
@@ -1323,35 +1837,227 @@ class MonitoringSystem:
         score -= inactive_agents * 10
         
         # Deduct for recent alerts
-        recent_alerts = len([a for a in self.alerts if 
-                           datetime.fromisoformat(a['timestamp']) > datetime.now() - timedelta(hours=1)])
+        # Alerts are appended in time order, so count back from the newest until one is too old
+        cutoff = time.monotonic() - 3600
+        recent_alerts = 0
+        for raised_at in reversed(self._alert_times):
+            if raised_at <= cutoff:
+                break
+            recent_alerts += 1
         score -= recent_alerts * 5
         
         return max(0.0, min(100.0, score))
 
+# Kickoff prompt sent to a new project's lead agents, filled in with str.format_map
+_ANALYSIS_TEMPLATE = """
+        Analyze the {name} project and create a comprehensive development plan.
+        
+        Project Details:
+        - Type: {type}
+        - Phase: {phase}
+        - Technologies: {technologies}
+        - Path: {path}
+        
+        Tasks:
+        1. Analyze current codebase structure
+        2. Identify immediate priorities and issues
+        3. Create development roadmap
+        4. Set up development environment
+        5. Begin implementation of highest priority items
+        
+        Use all available tools to gather intelligence and create an optimal development strategy.
+        """
+
+# Capabilities and tools are fixed per team role; every AgentConfig shares these tuples
+_MANAGER_CAPABILITIES = ('project_management', 'quality_assurance', 'team_coordination')
+_MANAGER_TOOLS = ('taskmaster', 'dart', 'github', 'memory')
+_DEVELOPER_CAPABILITIES = ('code_development', 'architecture', 'testing')
+_DEVELOPER_TOOLS = ('deep-code-reasoning', 'context7', 'github', 'playwright')
+_FRONTEND_CAPABILITIES = ('frontend_development', 'ui_testing', 'performance')
+_FRONTEND_TOOLS = ('playwright', 'puppeteer', 'context7')
+_BACKEND_CAPABILITIES = ('backend_development', 'api_design', 'database')
+_BACKEND_TOOLS = ('deep-code-reasoning', 'context7', 'github')
+_QA_CAPABILITIES = ('testing', 'quality_assurance', 'automation')
+_QA_TOOLS = ('playwright', 'puppeteer', 'github')
+_DEVOPS_CAPABILITIES = ('deployment', 'monitoring', 'infrastructure')
+_DEVOPS_TOOLS = ('github', 'docker', 'monitoring')
+
+@lru_cache(maxsize=32)
+def _team_templates(project_type: ProjectType, complexity: str, phase: ProjectPhase) -> Tuple[AgentConfig, ...]:
+    """Agent team templates for a project shape, with an empty session name to fill per project"""
+    # Base team configuration
+    team_configs = [
+        AgentConfig(
+            role=AgentRole.PROJECT_MANAGER,
+            session_name="",
+            window_name="Project-Manager",
+            capabilities=_MANAGER_CAPABILITIES,
+            tools=_MANAGER_TOOLS
+        ),
+        AgentConfig(
+            role=AgentRole.DEVELOPER,
+            session_name="",
+            window_name="Developer",
+            capabilities=_DEVELOPER_CAPABILITIES,
+            tools=_DEVELOPER_TOOLS
+        )
+    ]
+    
+    # Add specialized agents based on project type
+    if project_type in [ProjectType.REACT_APP, ProjectType.NEXTJS_APP]:
+        team_configs.append(AgentConfig(
+            role=AgentRole.DEVELOPER,
+            session_name="",
+            window_name="Frontend-Developer",
+            capabilities=_FRONTEND_CAPABILITIES,
+            tools=_FRONTEND_TOOLS
+        ))
+
+    if project_type in [ProjectType.PYTHON_API, ProjectType.NODEJS_API]:
+        team_configs.append(AgentConfig(
+            role=AgentRole.DEVELOPER,
+            session_name="",
+            window_name="Backend-Developer",
+            capabilities=_BACKEND_CAPABILITIES,
+            tools=_BACKEND_TOOLS
+        ))
+    
+    # Add QA for complex projects
+    if complexity in ['high', 'complex']:
+        team_configs.append(AgentConfig(
+            role=AgentRole.QA_ENGINEER,
+            session_name="",
+            window_name="QA-Engineer",
+            capabilities=_QA_CAPABILITIES,
+            tools=_QA_TOOLS
+        ))
+    
+    # Add DevOps for deployment-ready projects
+    if phase in [ProjectPhase.DEPLOYMENT, ProjectPhase.MAINTENANCE]:
+        team_configs.append(AgentConfig(
+            role=AgentRole.DEVOPS,
+            session_name="",
+            window_name="DevOps-Engineer",
+            capabilities=_DEVOPS_CAPABILITIES,
+            tools=_DEVOPS_TOOLS
+        ))
+    
+    return tuple(team_configs)
+
 class AutonomousOrchestrator:
     """Main orchestrator class that coordinates all components"""
     
     def __init__(self):
-        self.memory_manager = MemoryManager()
-        self.project_detector = ProjectDetector()
-        self.claude_handler = ClaudeConfigHandler(self)
-        self.tool_integrator = ToolIntegrator(self)
-        self.agent_manager = AgentManager(self)
-        self.security_manager = SecurityManager(self)
-        self.monitoring_system = MonitoringSystem(self)
+        # Subsystems are built on first use so short CLI paths like --status only pay for what they touch
+        self._memory_manager: Optional[MemoryManager] = None
+        self._project_detector: Optional[ProjectDetector] = None
+        self._claude_handler: Optional[ClaudeConfigHandler] = None
+        self._tool_integrator: Optional[ToolIntegrator] = None
+        self._agent_manager: Optional[AgentManager] = None
+        self._security_manager: Optional[SecurityManager] = None
+        self._monitoring_system: Optional[MonitoringSystem] = None
         
         self.active_projects = {}
+        # Paths between the active_projects check and registration, so a path is onboarded once
+        self._onboarding: Set[str] = set()
         self.running = False
+        # Checkpoint of active projects; compact unless a human-readable export is requested
+        self.state_file = Path('/tmp/orchestrator-state.json')
+        self.human_readable_state = False
+        # Set once start() has merged the saved checkpoint, so one-shot CLI runs never overwrite it
+        self._state_loaded = False
+        self.snapshot_interval = 300
+        self._last_snapshot = time.monotonic()
+        # (next_check, project_path) min-heap so each tick only touches projects that are due
+        self.project_check_interval = 60
+        self._check_heap: List[Tuple[float, str]] = []
+        # Circuit breaker per project: path -> (consecutive failures, opened_at); open projects are
+        # skipped for breaker_cooldown seconds, then get one half-open probe
+        self.breaker_threshold = 3
+        self.breaker_cooldown = 300
+        self._breakers: Dict[str, Tuple[int, float]] = {}
+        # LRU of CLAUDE.md scans keyed by (directory, mtime_ns, size) of the file itself
+        self.claude_scan_cache_size = 256
+        self._claude_scan_cache: OrderedDict = OrderedDict()
+        # Set to run the next main-loop iteration early (new project, shutdown)
+        self._wake_event = asyncio.Event()
+        # base_dir -> (st_mtime_ns, subdirectory paths) so unchanged directories are not re-listed
+        self._dir_cache: Dict[str, Tuple[int, List[str]]] = {}
+        # New project directories arrive as filesystem events; the full sweep becomes a safety net
+        self.rescan_interval = 600
+        self._last_full_scan = 0.0
+        self._project_observer = None
+        self._project_events: Optional[asyncio.Queue] = None
+        self._project_event_task: Optional[asyncio.Task] = None
+        # (expiry, payload) so bursts of status polls share one health check
+        self.status_cache_ttl = 1.0
+        self._status_cache: Optional[Tuple[float, Dict[str, Any]]] = None
         
         # Setup signal handlers
         signal.signal(signal.SIGINT, self._signal_handler)
         signal.signal(signal.SIGTERM, self._signal_handler)
     
+    @property
+    def memory_manager(self) -> MemoryManager:
+        """Memory manager, created on first use"""
+        if self._memory_manager is None:
+            self._memory_manager = MemoryManager()
+        return self._memory_manager
+    
+    @property
+    def project_detector(self) -> ProjectDetector:
+        """Project detector, created on first use"""
+        if self._project_detector is None:
+            self._project_detector = ProjectDetector()
+        return self._project_detector
+    
+    @property
+    def claude_handler(self) -> ClaudeConfigHandler:
+        """Claude handler, created on first use"""
+        if self._claude_handler is None:
+            self._claude_handler = ClaudeConfigHandler(self)
+        return self._claude_handler
+    
+    @property
+    def tool_integrator(self) -> ToolIntegrator:
+        """Tool integrator, created on first use"""
+        if self._tool_integrator is None:
+            self._tool_integrator = ToolIntegrator(self)
+        return self._tool_integrator
+    
+    @property
+    def agent_manager(self) -> AgentManager:
+        """Agent manager, created on first use"""
+        if self._agent_manager is None:
+            self._agent_manager = AgentManager(self)
+        return self._agent_manager
+    
+    @property
+    def security_manager(self) -> SecurityManager:
+        """Security manager, created on first use"""
+        if self._security_manager is None:
+            self._security_manager = SecurityManager(self)
+        return self._security_manager
+    
+    @property
+    def monitoring_system(self) -> MonitoringSystem:
+        """Monitoring system, created on first use"""
+        if self._monitoring_system is None:
+            self._monitoring_system = MonitoringSystem(self)
+        return self._monitoring_system
+    
     def _signal_handler(self, signum, frame):
         """Handle shutdown signals"""
         logger.info(f"Received signal {signum}, shutting down...")
         self.running = False
+        self._wake()
+    
+    def _wake(self) -> None:
+        """Wake the main loop from any context, including signal handlers"""
+        try:
+            asyncio.get_running_loop().call_soon_threadsafe(self._wake_event.set)
+        except RuntimeError:
+            self._wake_event.set()
     
     async def start(self) -> None:
         """Start the orchestrator"""
@@ -1362,9 +2068,21 @@ class AutonomousOrchestrator:
         # Initialize components
         await self._initialize_components()
         
+        # Resume projects that were active before the last shutdown
+        restored = self._load_state()
+        self.active_projects.update(restored)
+        self._state_loaded = True
+        for path in restored:
+            self._schedule_project_check(path, time.monotonic())
+        if restored:
+            logger.info(f"Restored {len(restored)} active projects from {self.state_file}")
+        
         # Start monitoring
         await self.monitoring_system.start_monitoring()
         
+        # Watch project base directories for new projects
+        self._start_project_watcher()
+        
         # Start main loop
         await self._main_loop()
     
@@ -1399,19 +2117,26 @@ class AutonomousOrchestrator:
             'tmux-orchestrator'
         ]
         
-        for tool in tools_to_integrate:
-            try:
-                await self.tool_integrator.integrate_tool(tool, {})
+        # Integrations are independent, so prewarm them all concurrently
+        outcomes = await asyncio.gather(*[
+            self.tool_integrator.integrate_tool(tool, {}) for tool in tools_to_integrate
+        ], return_exceptions=True)
+        
+        for tool, outcome in zip(tools_to_integrate, outcomes):
+            if isinstance(outcome, Exception):
+                logger.warning(f"Failed to integrate tool {tool}: {outcome}")
+            else:
                 logger.info(f"Integrated tool: {tool}")
-            except Exception as e:
-                logger.warning(f"Failed to integrate tool {tool}: {e}")
     
     async def _main_loop(self) -> None:
         """Main orchestrator loop"""
         while self.running:
             try:
-                # Check for new projects
-                await self._scan_for_projects()
+                # Check for new projects; with a watcher running, only sweep occasionally
+                now = time.monotonic()
+                if self._project_observer is None or now - self._last_full_scan >= self.rescan_interval:
+                    await self._scan_for_projects()
+                    self._last_full_scan = now
                 
                 # Process active projects
                 await self._process_active_projects()
@@ -1419,33 +2144,115 @@ class AutonomousOrchestrator:
                 # Memory cleanup
                 self.memory_manager.cleanup_if_needed()
                 
-                # Sleep before next iteration
-                await asyncio.sleep(60)  # Check every minute
+                # Periodic state snapshot so a crash loses at most one interval
+                if now - self._last_snapshot >= self.snapshot_interval:
+                    await self._save_state()
+                    self._last_snapshot = now
+                
+                # Wait before next iteration, waking early when something changes
+                await self._wait_for_wake(60)  # Check every minute
                 
             except Exception as e:
                 logger.error(f"Main loop error: {e}")
                 await asyncio.sleep(60)
     
-    async def _scan_for_projects(self) -> None:
-        """Scan for new projects and CLAUDE.md files"""
-        # Common project directories
-        project_dirs = [
+    def _get_project_dirs(self) -> List[str]:
+        """Common project directories"""
+        return [
             "/mnt/c/ai-development-ecosystem/autonomous-claude-system/projects",
             "/mnt/c/ai-development-ecosystem/autonomous-claude-system",
             os.path.expanduser("~/Coding"),
             os.path.expanduser("~/Projects"),
             os.path.expanduser("~/workspace")
         ]
+    
+    def _start_project_watcher(self) -> bool:
+        """Queue directories created in or moved into a project base directory"""
+        try:
+            from watchdog.observers import Observer
+            from watchdog.events import FileSystemEventHandler
+        except ImportError:
+            logger.warning("watchdog not available, polling for new projects")
+            return False
+        
+        base_dirs = {d for d in self._get_project_dirs() if os.path.isdir(d)}
+        if not base_dirs:
+            return False
         
-        for base_dir in project_dirs:
-            if os.path.exists(base_dir):
-                for item in os.listdir(base_dir):
-                    item_path = os.path.join(base_dir, item)
-                    if os.path.isdir(item_path) and item_path not in self.active_projects:
-                        await self._process_potential_project(item_path)
+        loop = asyncio.get_running_loop()
+        events = self._project_events = asyncio.Queue()
+        
+        def on_new_directory(event):
+            # Runs on the observer thread; hand matching paths to the event loop
+            path = os.fsdecode(getattr(event, 'dest_path', '') or event.src_path)
+            if event.is_directory and os.path.dirname(path) in base_dirs:
+                loop.call_soon_threadsafe(events.put_nowait, os.path.realpath(path))
+        
+        handler = FileSystemEventHandler()
+        handler.on_created = handler.on_moved = on_new_directory
+        
+        try:
+            observer = Observer()
+            for base_dir in base_dirs:
+                observer.schedule(handler, base_dir, recursive=False)
+            observer.daemon = True
+            observer.start()
+        except OSError as e:
+            logger.warning(f"Project watcher unavailable, polling instead: {e}")
+            return False
+        
+        self._project_observer = observer
+        self._project_event_task = asyncio.create_task(self._process_project_events())
+        return True
+    
+    async def _process_project_events(self) -> None:
+        """Process new project directories reported by the watcher"""
+        while True:
+            project_path = await self._project_events.get()
+            await self._process_potential_project(project_path)
+            if project_path in self.active_projects:
+                self._wake()
+    
+    async def _wait_for_wake(self, timeout: float) -> None:
+        """Sleep until timeout or until _wake() is called"""
+        try:
+            await asyncio.wait_for(self._wake_event.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        self._wake_event.clear()
+    
+    async def _scan_for_projects(self) -> None:
+        """Scan for new projects and CLAUDE.md files"""
+        for base_dir in self._get_project_dirs():
+            for item_path in self._list_project_dirs(base_dir):
+                await self._process_potential_project(item_path)
+    
+    def _list_project_dirs(self, base_dir: str) -> List[str]:
+        """Subdirectories of base_dir, re-listed only when its mtime changes"""
+        try:
+            mtime = os.stat(base_dir).st_mtime_ns
+        except OSError:
+            self._dir_cache.pop(base_dir, None)
+            return []
+        
+        cached = self._dir_cache.get(base_dir)
+        if cached and cached[0] == mtime:
+            return cached[1]
+        
+        with os.scandir(base_dir) as it:
+            subdirs = [os.path.realpath(entry.path) for entry in it if entry.is_dir()]
+        self._dir_cache[base_dir] = (mtime, subdirs)
+        return subdirs
     
     async def _process_potential_project(self, project_path: str) -> None:
         """Process a potential project directory"""
+        # Register projects under their canonical path so symlinked entries share one key
+        project_path = os.path.realpath(project_path)
+        # The watcher and the full scan can report the same directory while detection is awaited
+        if project_path in self.active_projects or project_path in self._onboarding:
+            return
+        
+        self._onboarding.add(project_path)
         try:
             # Check for CLAUDE.md first
             claude_config = await self.claude_handler.scan_directory(project_path)
@@ -1459,6 +2266,8 @@ class AutonomousOrchestrator:
                 
         except Exception as e:
             logger.error(f"Failed to process project {project_path}: {e}")
+        finally:
+            self._onboarding.discard(project_path)
     
     async def _activate_project(self, project_config: ProjectConfig, claude_config: Optional[Dict[str, Any]]) -> None:
         """Activate a project with autonomous development"""
@@ -1469,8 +2278,10 @@ class AutonomousOrchestrator:
             'config': project_config,
             'claude_config': claude_config,
             'activated_at': datetime.now().isoformat(),
-            'agents': {}
+            'agents': {},
+            'agent_ids': self._team_agent_ids(project_config)
         }
+        self._schedule_project_check(project_config.path, time.monotonic())
         
         # Create appropriate agent team
         await self._create_project_team(project_config)
@@ -1484,113 +2295,90 @@ class AutonomousOrchestrator:
         # Start development workflow
         await self._start_development_workflow(project_config)
     
+    def _team_agent_ids(self, project_config: ProjectConfig) -> Dict[str, str]:
+        """Agent ids of a project's team keyed by window name, built once at registration"""
+        templates = _team_templates(project_config.type, project_config.complexity, project_config.phase)
+        return {
+            template.window_name: sys.intern(f"{project_config.name}:{template.window_name}")
+            for template in templates
+        }
+    
     async def _create_project_team(self, project_config: ProjectConfig) -> None:
         """Create appropriate agent team for project"""
-        project_name = project_config.name
+        # Team shape depends only on type, complexity and phase; reuse the cached templates
+        templates = _team_templates(project_config.type, project_config.complexity, project_config.phase)
         
-        # Base team configuration
-        team_configs = [
-            AgentConfig(
-                role=AgentRole.PROJECT_MANAGER,
-                session_name=f"{project_name}",
-                window_name="Project-Manager",
-                capabilities=['project_management', 'quality_assurance', 'team_coordination'],
-                tools=['taskmaster', 'dart', 'github', 'memory']
-            ),
-            AgentConfig(
-                role=AgentRole.DEVELOPER,
-                session_name=f"{project_name}",
-                window_name="Developer",
-                capabilities=['code_development', 'architecture', 'testing'],
-                tools=['deep-code-reasoning', 'context7', 'github', 'playwright']
-            )
-        ]
+        # Create the shared session up front so concurrent new-window calls can all find it
+        await self.agent_manager.ensure_session(project_config.name)
         
-        # Add specialized agents based on project type
-        if project_config.type in [ProjectType.REACT_APP, ProjectType.NEXTJS_APP]:
-            team_configs.append(AgentConfig(
-                role=AgentRole.DEVELOPER,
-                session_name=f"{project_name}",
-                window_name="Frontend-Developer",
-                capabilities=['frontend_development', 'ui_testing', 'performance'],
-                tools=['playwright', 'puppeteer', 'context7']
-            ))
-        
-        if project_config.type in [ProjectType.PYTHON_API, ProjectType.NODEJS_API]:
-            team_configs.append(AgentConfig(
-                role=AgentRole.DEVELOPER,
-                session_name=f"{project_name}",
-                window_name="Backend-Developer",
-                capabilities=['backend_development', 'api_design', 'database'],
-                tools=['deep-code-reasoning', 'context7', 'github']
-            ))
-        
-        # Add QA for complex projects
-        if project_config.complexity in ['high', 'complex']:
-            team_configs.append(AgentConfig(
-                role=AgentRole.QA_ENGINEER,
-                session_name=f"{project_name}",
-                window_name="QA-Engineer",
-                capabilities=['testing', 'quality_assurance', 'automation'],
-                tools=['playwright', 'puppeteer', 'github']
-            ))
-        
-        # Add DevOps for deployment-ready projects
-        if project_config.phase in [ProjectPhase.DEPLOYMENT, ProjectPhase.MAINTENANCE]:
-            team_configs.append(AgentConfig(
-                role=AgentRole.DEVOPS,
-                session_name=f"{project_name}",
-                window_name="DevOps-Engineer",
-                capabilities=['deployment', 'monitoring', 'infrastructure'],
-                tools=['github', 'docker', 'monitoring']
-            ))
-        
-        # Create all agents
-        for agent_config in team_configs:
-            await self.agent_manager.create_agent(agent_config)
+        # Create all agents concurrently; spawn time becomes the slowest agent, not the sum
+        await asyncio.gather(*(
+            self.agent_manager.create_agent(replace(template, session_name=project_config.name))
+            for template in templates
+        ))
     
     async def _start_development_workflow(self, project_config: ProjectConfig) -> None:
         """Start the development workflow for a project"""
         project_name = project_config.name
         
         # Initial project analysis and planning
-        analysis_task = f"""
-        Analyze the {project_name} project and create a comprehensive development plan.
-        
-        Project Details:
-        - Type: {project_config.type.value}
-        - Phase: {project_config.phase.value}
-        - Technologies: {', '.join(project_config.technologies)}
-        - Path: {project_config.path}
-        
-        Tasks:
-        1. Analyze current codebase structure
-        2. Identify immediate priorities and issues
-        3. Create development roadmap
-        4. Set up development environment
-        5. Begin implementation of highest priority items
-        
-        Use all available tools to gather intelligence and create an optimal development strategy.
-        """
+        analysis_task = _ANALYSIS_TEMPLATE.format_map({
+            'name': project_name,
+            'type': project_config.type.value,
+            'phase': project_config.phase.value,
+            'technologies': ', '.join(project_config.technologies),
+            'path': project_config.path
+        })
         
         # Coordinate agents for initial analysis
-        agent_ids = [f"{project_name}:Project-Manager", f"{project_name}:Developer"]
+        team_ids = self.active_projects[project_config.path]['agent_ids']
+        agent_ids = [team_ids['Project-Manager'], team_ids['Developer']]
         await self.agent_manager.coordinate_agents(analysis_task, agent_ids)
     
     async def _process_active_projects(self) -> None:
-        """Process and monitor active projects"""
-        for project_path, project_data in self.active_projects.items():
-            try:
-                project_config = project_data['config']
-                
-                # Check project health
-                await self._check_project_health(project_config)
-                
-                # Process any pending tasks
-                await self._process_project_tasks(project_config)
-                
-            except Exception as e:
+        """Process and monitor active projects that are due for a check"""
+        now = time.monotonic()
+        due = []
+        while self._check_heap and self._check_heap[0][0] <= now:
+            _, project_path = heapq.heappop(self._check_heap)
+            # Entries for projects that are no longer active are dropped lazily here
+            if project_path in self.active_projects:
+                due.append(project_path)
+                self._schedule_project_check(project_path, now + self.project_check_interval)
+        
+        # Projects are independent, so process them all concurrently
+        await asyncio.gather(*[
+            self._process_project(project_path, self.active_projects[project_path]['config'])
+            for project_path in due
+        ])
+    
+    def _schedule_project_check(self, project_path: str, when: float) -> None:
+        """Queue a project for processing at monotonic time when"""
+        heapq.heappush(self._check_heap, (when, project_path))
+    
+    async def _process_project(self, project_path: str, project_config: ProjectConfig) -> None:
+        """Check health and run pending tasks for one active project"""
+        failures, opened_at = self._breakers.get(project_path, (0, 0.0))
+        if failures >= self.breaker_threshold and time.monotonic() - opened_at < self.breaker_cooldown:
+            return
+        
+        try:
+            # Check project health
+            await self._check_project_health(project_config)
+            
+            # Process any pending tasks
+            await self._process_project_tasks(project_config)
+            
+        except Exception as e:
+            failures += 1
+            if failures < self.breaker_threshold:
                 logger.error(f"Error processing project {project_path}: {e}")
+                self._breakers[project_path] = (failures, 0.0)
+            else:
+                logger.error(f"Error processing project {project_path}, pausing checks for {self.breaker_cooldown}s: {e}")
+                self._breakers[project_path] = (failures, time.monotonic())
+        else:
+            self._breakers.pop(project_path, None)
     
     async def _check_project_health(self, project_config: ProjectConfig) -> None:
         """Check project health and status"""
@@ -1606,84 +2394,173 @@ class AutonomousOrchestrator:
         """Handle Claude Code entering a new directory"""
         logger.info(f"Claude Code entered directory: {directory}")
         
+        # Known projects need no filesystem scan; keys are canonical paths
+        directory = os.path.realpath(directory)
+        if directory in self.active_projects:
+            return
+        
         # Check for CLAUDE.md
-        claude_config = await self.claude_handler.scan_directory(directory)
+        claude_config = await self._scan_claude_directory(directory)
         
         if claude_config:
             logger.info(f"Found CLAUDE.md in {directory}, activating configuration")
             # Configuration already activated by scan_directory
         else:
             # Check if it's a project directory
-            if directory not in self.active_projects:
-                await self._process_potential_project(directory)
+            await self._process_potential_project(directory)
+    
+    async def _scan_claude_directory(self, directory: str) -> Optional[Dict[str, Any]]:
+        """Scan a directory for CLAUDE.md unless the same file was already scanned unchanged"""
+        try:
+            st = os.stat(os.path.join(directory, 'CLAUDE.md'))
+        except OSError:
+            return None
+        
+        key = (directory, st.st_mtime_ns, st.st_size)
+        if key in self._claude_scan_cache:
+            self._claude_scan_cache.move_to_end(key)
+            return self._claude_scan_cache[key]
+        
+        claude_config = await self.claude_handler.scan_directory(directory)
+        self._claude_scan_cache[key] = claude_config
+        if len(self._claude_scan_cache) > self.claude_scan_cache_size:
+            self._claude_scan_cache.popitem(last=False)
+        return claude_config
     
     async def get_system_status(self) -> Dict[str, Any]:
         """Get comprehensive system status"""
-        return {
+        now = time.monotonic()
+        if self._status_cache is not None and now < self._status_cache[0]:
+            return self._status_cache[1]
+        
+        status = {
             'timestamp': datetime.now().isoformat(),
             'running': self.running,
             'active_projects': len(self.active_projects),
-            'integrated_tools': len(self.tool_integrator.tools),
-            'active_agents': len(self.agent_manager.agents),
+            'integrated_tools': len(self._tool_integrator.tools) if self._tool_integrator else 0,
+            'active_agents': len(self._agent_manager.agents) if self._agent_manager else 0,
             'health_status': await self.monitoring_system.get_health_status(),
             'memory_usage': self.memory_manager.check_memory_usage()
         }
+        self._status_cache = (now + self.status_cache_ttl, status)
+        return status
     
     async def shutdown(self) -> None:
         """Shutdown the orchestrator"""
         logger.info("Shutting down Autonomous Development Orchestrator...")
         
         self.running = False
+        self._wake()
         
-        # Save state
-        await self._save_state()
+        # Stop watching for new projects
+        if self._project_observer is not None:
+            self._project_observer.stop()
+            self._project_event_task.cancel()
+            self._project_observer = None
+        
+        # Save state, unless this run never loaded it (e.g. --status) and would blank the checkpoint
+        if self._state_loaded:
+            await self._save_state()
         
         # Cleanup resources
-        self.memory_manager.cleanup_memory()
+        if self._security_manager is not None:
+            self._security_manager.shutdown()
+        if self._memory_manager is not None:
+            self._memory_manager.cleanup_memory()
         
         logger.info("Shutdown complete")
     
     async def _save_state(self) -> None:
         """Save orchestrator state"""
+        # orjson encodes the ProjectConfig dataclass directly, enums by value
         state = {
             'timestamp': datetime.now().isoformat(),
             'active_projects': {
                 path: {
-                    'config': {
-                        'name': data['config'].name,
-                        'type': data['config'].type.value,
-                        'phase': data['config'].phase.value,
-                        'technologies': data['config'].technologies
-                    },
+                    'config': data['config'],
+                    'claude_config': data['claude_config'],
                     'activated_at': data['activated_at']
                 }
                 for path, data in self.active_projects.items()
             }
         }
         
-        state_file = Path('/tmp/orchestrator-state.json')
-        with open(state_file, 'w') as f:
-            json.dump(state, f, indent=2)
+        # Encode on the loop so the snapshot is consistent; only the file write leaves it
+        option = orjson.OPT_INDENT_2 if self.human_readable_state else 0
+        payload = orjson.dumps(state, default=str, option=option)
+        await asyncio.to_thread(self._write_state_file, payload)
+    
+    def _write_state_file(self, payload: bytes) -> None:
+        """Write the state file in one write, then swap it in atomically"""
+        tmp = self.state_file.with_suffix('.tmp')
+        tmp.write_bytes(payload)
+        os.replace(tmp, self.state_file)
+    
+    def _load_state(self) -> Dict[str, Dict[str, Any]]:
+        """Load active projects saved by _save_state, skipping paths that no longer exist"""
+        try:
+            state = orjson.loads(self.state_file.read_bytes())
+        except FileNotFoundError:
+            return {}
+        except (OSError, orjson.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable state file {self.state_file}: {e}")
+            return {}
+        if not isinstance(state, dict) or not isinstance(state.get('active_projects', {}), dict):
+            logger.warning(f"Ignoring malformed state file {self.state_file}")
+            return {}
+        
+        projects = {}
+        for path, data in state.get('active_projects', {}).items():
+            if not os.path.isdir(path):
+                continue
+            try:
+                config = data['config']
+                project_config = ProjectConfig(**{
+                    **config,
+                    'path': path,
+                    'type': ProjectType(config['type']),
+                    'phase': ProjectPhase(config['phase'])
+                })
+                projects[path] = {
+                    'config': project_config,
+                    'claude_config': data.get('claude_config'),
+                    'activated_at': data['activated_at'],
+                    'agents': {},
+                    'agent_ids': self._team_agent_ids(project_config)
+                }
+            except (KeyError, TypeError, ValueError) as e:
+                logger.warning(f"Skipping saved project {path}: {e}")
+        return projects
 
 # CLI Interface
+_PARSER = argparse.ArgumentParser(description='Autonomous Development Platform Orchestrator')
+_PARSER.add_argument('--directory', '-d', help='Directory to process')
+_PARSER.add_argument('--status', '-s', action='store_true', help='Show system status')
+_PARSER.add_argument('--daemon', action='store_true', help='Run as daemon')
+_PARSER.add_argument('--human-readable', action='store_true', help='Write the saved state file indented')
+
+def _queue_logging() -> logging.handlers.QueueListener:
+    """Move the root log handlers onto a listener thread so logging calls only enqueue"""
+    root = logging.getLogger()
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, *root.handlers, respect_handler_level=True)
+    root.handlers = [logging.handlers.QueueHandler(log_queue)]
+    listener.start()
+    return listener
+
 async def main():
     """Main entry point"""
-    import argparse
-    
-    parser = argparse.ArgumentParser(description='Autonomous Development Platform Orchestrator')
-    parser.add_argument('--directory', '-d', help='Directory to process')
-    parser.add_argument('--status', '-s', action='store_true', help='Show system status')
-    parser.add_argument('--daemon', action='store_true', help='Run as daemon')
-    
-    args = parser.parse_args()
+    args = _PARSER.parse_args()
+    log_listener = _queue_logging()
     
     orchestrator = AutonomousOrchestrator()
+    orchestrator.human_readable_state = args.human_readable
     
     try:
         if args.status:
             # Show status and exit
             status = await orchestrator.get_system_status()
-            print(json.dumps(status, indent=2))
+            print(orjson.dumps(status, default=str, option=orjson.OPT_INDENT_2).decode())
             return
             
         if args.directory:
@@ -1701,6 +2578,7 @@ async def main():
         traceback.print_exc()
     finally:
         await orchestrator.shutdown()
+        log_listener.stop()  # Flushes queued records
 
 if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file
@@ -17,24 +17,33 @@ Version: 1.0.0
 import asyncio
 import json
 import logging
+import logging.handlers
 import os
+import random
 import re
+import sys
 import time
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Any, Tuple
-from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, List, Optional, Set, Any, Tuple
+from dataclasses import asdict, dataclass, field, replace
 from enum import Enum
+from functools import lru_cache
+from array import array
+from bisect import bisect_right
 import yaml
-import subprocess
 import hashlib
+import secrets
 import tempfile
 import difflib
-from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 import threading
 import queue
 import psutil
 import aiohttp
+import aiofiles
+import aiofiles.os
 import redis
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
@@ -42,6 +51,21 @@ import ast
 import tokenize
 from io import StringIO
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader
+
+try:
+    import hyperscan  # Matches all security patterns in one automaton pass
+except ImportError:
+    hyperscan = None
+
+try:
+    import coverage  # Measured test coverage from the projects' .coverage data
+except ImportError:
+    coverage = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -72,7 +96,10 @@ class WorkType(Enum):
     SECURITY = "security"
     PERFORMANCE = "performance"
 
-@dataclass
+# Slotted review results drop the per-instance __dict__; slots=True needs Python 3.10+
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_SLOTS)
 class QualityMetrics:
     """Metrics for quality assessment"""
     code_quality: float = 0.0
@@ -95,7 +122,7 @@ class QualityMetrics:
         ]
         self.overall_score = sum(metrics) / len(metrics)
 
-@dataclass
+@dataclass(**_SLOTS)
 class QualityIssue:
     """Represents a quality issue found during review"""
     issue_type: str
@@ -124,11 +151,391 @@ class WorkItem:
     timestamp: datetime = field(default_factory=datetime.now)
     revision_count: int = 0
     max_revisions: int = 3
+    python_analysis: Optional[Dict[str, Any]] = None  # Set per review for .py files, see _analyze_python_ast
+    # Values derived from content, rebuilt whenever content is replaced (e.g. by auto-fix)
+    _derived: Dict[str, Any] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _derived_from: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __getstate__(self):
+        # Derived values, syntax trees especially, are cheaper to rebuild than to pickle
+        state = self.__dict__.copy()
+        state['_derived'] = {}
+        state['_derived_from'] = None
+        return state
+    
+    def _derived_values(self) -> Dict[str, Any]:
+        """Cache of derived values for the current content"""
+        if self._derived_from is not self.content:
+            self._derived = {}
+            self._derived_from = self.content
+        return self._derived
+    
+    def lines(self) -> List[str]:
+        """Content split into lines, computed once per revision"""
+        derived = self._derived_values()
+        if 'lines' not in derived:
+            derived['lines'] = self.content.split('\n')
+        return derived['lines']
+    
+    def content_digest(self) -> bytes:
+        """16-byte BLAKE2b digest of the content, computed once per revision"""
+        derived = self._derived_values()
+        if 'digest' not in derived:
+            derived['digest'] = hashlib.blake2b(self.content.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+        return derived['digest']
+    
+    def ast_analysis(self) -> Optional[Dict[str, Any]]:
+        """Python AST analysis of the content (see _analyze_python_ast), computed once per revision"""
+        derived = self._derived_values()
+        if 'ast' not in derived:
+            derived['ast'] = _analyze_python_ast(self.content)
+        return derived['ast']
+
+def _any_of(patterns: List[str], flags: int = 0) -> re.Pattern:
+    """One bytes alternation that matches wherever any of the patterns would, so a family costs one scan"""
+    return re.compile('|'.join(f'(?:{p})' for p in patterns).encode(), flags)
+
+# Review patterns are compiled once at import; the review helpers only run the scans. They are bytes
+# patterns run over the content's UTF-8 encoding (see _content_bytes): all of them are ASCII, and
+# bytes mode skips Unicode case folding and character classes.
+_ERROR_HANDLING_RE = _any_of([
+    r'try\s*:',
+    r'except\s+\w+',
+    r'catch\s*\(',
+    r'throw\s+',
+    r'raise\s+',
+    r'error\s*\(',
+    r'Error\s*\('
+], re.IGNORECASE)
+
+_LOGGING_RE = _any_of([
+    r'logger\.',
+    r'log\.',
+    r'console\.log',
+    r'print\s*\(',
+    r'logging\.',
+    r'log\s*\('
+], re.IGNORECASE)
+
+_DOC_RE = _any_of([
+    r'""".*?"""',
+    r"'''.*?'''",
+    r'/\*\*.*?\*/',
+    r'//.*',
+    r'#.*'
+], re.DOTALL)
+
+# The ternary pattern spans text that may contain keywords, so it is counted on its own
+_TERNARY_RE = re.compile(rb'\b\?\s*.*\s*:\s*', re.IGNORECASE)
+
+# Branch keywords counted as whole words. Matching is bytes-mode, so \b and IGNORECASE are ASCII-only;
+# a keyword missing from the lowercased text cannot match
+_COMPLEXITY_KEYWORDS = (b'if', b'else', b'elif', b'while', b'for', b'try', b'except', b'case', b'switch', b'and', b'or')
+
+@lru_cache(maxsize=256)
+def _complexity_keywords_re(keywords: Tuple[bytes, ...]) -> re.Pattern:
+    """Word-boundary alternation over just the given complexity keywords"""
+    return _any_of([rf'\b{keyword.decode()}\b' for keyword in keywords], re.IGNORECASE)
+
+# Common security anti-patterns: (pattern, issue type, description)
+_SECURITY_PATTERNS = [
+    (r'eval\s*\(', "dangerous_eval", "Use of eval() function is dangerous"),
+    (r'exec\s*\(', "dangerous_exec", "Use of exec() function is dangerous"),
+    (r'input\s*\(', "dangerous_input", "Direct user input without validation"),
+    (r'pickle\.loads', "dangerous_pickle", "Pickle deserialization is dangerous"),
+    (r'shell=True', "dangerous_shell", "Shell injection vulnerability"),
+    (r'subprocess\.\w+.*shell=True', "dangerous_subprocess", "Subprocess with shell=True is dangerous"),
+    (r'password\s*=\s*["\'].*["\']', "hardcoded_password", "Hardcoded password detected"),
+    (r'api_key\s*=\s*["\'].*["\']', "hardcoded_api_key", "Hardcoded API key detected"),
+    (r'secret\s*=\s*["\'].*["\']', "hardcoded_secret", "Hardcoded secret detected"),
+]
+_SECURITY_RES = tuple((re.compile(p.encode(), re.IGNORECASE), t, d) for p, t, d in _SECURITY_PATTERNS)
+# Literals each security pattern needs (lowercase); the regex only runs when all of them appear
+_SECURITY_TRIGGERS = (
+    (b'eval',),
+    (b'exec',),
+    (b'input',),
+    (b'pickle.loads',),
+    (b'shell=true',),
+    (b'subprocess.', b'shell=true'),
+    (b'password',),
+    (b'api_key',),
+    (b'secret',),
+)
+
+def _compile_security_db():
+    """Hyperscan database of the security patterns, or None to use the re fallback"""
+    if hyperscan is None:
+        return None
+    # SINGLEMATCH: only whether each pattern matches matters; UTF8/UCP keep \w and \s Unicode-aware like re
+    flags = hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH | hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP
+    try:
+        db = hyperscan.Database()
+        db.compile(
+            expressions=[p.encode() for p, _, _ in _SECURITY_PATTERNS],
+            ids=list(range(len(_SECURITY_PATTERNS))),
+            elements=len(_SECURITY_PATTERNS),
+            flags=[flags] * len(_SECURITY_PATTERNS)
+        )
+        return db
+    except hyperscan.error as e:
+        logger.warning(f"Hyperscan unavailable for security patterns, using re: {e}")
+        return None
+
+_SECURITY_DB = _compile_security_db()
+
+# Content scans that the review checks and the metric scores both run on the same content are
+# memoized. Both runs happen within one work item's review, so a small cache is enough and keeps
+# few file contents alive; str caches its own hash, so a repeat lookup doesn't rescan the text.
+_CONTENT_CACHE_SIZE = 64
+_NEWLINE_RE = re.compile(rb'\n')
+
+@lru_cache(maxsize=_CONTENT_CACHE_SIZE)
+def _content_bytes(content: str) -> bytes:
+    """UTF-8 encoding of content for the bytes review patterns, made once per content"""
+    return content.encode('utf-8', 'replace')
+
+@lru_cache(maxsize=_CONTENT_CACHE_SIZE)
+def _security_matches(content: str) -> Tuple[Tuple[int, int], ...]:
+    """(pattern index, byte offset of its first match) for each security pattern found in content"""
+    data = _content_bytes(content)
+    if _SECURITY_DB is None:
+        # Most files lack the literals entirely, so check for them before running any regex
+        lowered = data.lower()
+        found = []
+        for i, (pattern, _, _) in enumerate(_SECURITY_RES):
+            if all(trigger in lowered for trigger in _SECURITY_TRIGGERS[i]):
+                match = pattern.search(data)
+                if match:
+                    found.append((i, match.start()))
+        return tuple(found)
+    
+    matched = {}
+    
+    def on_match(pattern_id, start, end, flags, context):
+        # Without start-of-match tracking only the end is known; SINGLEMATCH reports the first one
+        matched.setdefault(pattern_id, end - 1)
+    
+    _SECURITY_DB.scan(data, match_event_handler=on_match)
+    return tuple(sorted(matched.items()))
+
+@lru_cache(maxsize=_CONTENT_CACHE_SIZE)
+def _newline_offsets(content: str) -> array:
+    """Byte offsets of the newlines in content's UTF-8 encoding, built once for all line lookups"""
+    return array('q', (match.start() for match in _NEWLINE_RE.finditer(_content_bytes(content))))
+
+def _line_number(content: str, offset: int) -> int:
+    """1-based line of a byte offset into content's UTF-8 encoding"""
+    return bisect_right(_newline_offsets(content), offset) + 1
+
+_TEST_TYPE_RES = {
+    test_type: _any_of(patterns, re.IGNORECASE)
+    for test_type, patterns in {
+        "unit": [r'test_\w+', r'unittest', r'describe\s*\(', r'it\s*\('],
+        "integration": [r'integration.*test', r'test.*integration', r'e2e.*test'],
+        "performance": [r'performance.*test', r'benchmark', r'load.*test'],
+        "security": [r'security.*test', r'test.*security', r'vulnerability.*test']
+    }.items()
+}
+
+_SENTENCE_END_RE = re.compile(rb'[.!?]+')
+# Byte table mapping vowels to b'a' and everything else to b' ', so syllables are counted with bytes.count
+_VOWEL_TABLE = bytes(ord('a') if byte in b'aeiouy' else ord(' ') for byte in range(256))
+
+_CONCERN_RES = tuple(re.compile(concern, re.IGNORECASE) for concern in [b"database", b"ui", b"business", b"validation", b"logging"])
+
+_FUNCTION_DEF_RE = re.compile(rb'def\s+\w+')
+
+_INJECTION_RE = _any_of([
+    r'__init__\s*\([^)]+\)',
+    r'constructor\s*\([^)]+\)',
+    r'@inject',
+    r'dependencies\s*='
+], re.IGNORECASE)
+
+_FACTORY_RE = _any_of([
+    r'class\s+\w+Factory',
+    r'def\s+create_\w+',
+    r'factory\s*\(',
+    r'Factory\s*\('
+], re.IGNORECASE)
+
+_PERFORMANCE_ISSUE_RES = tuple(re.compile(p, re.IGNORECASE) for p in [
+    rb'while\s+True\s*:',  # Infinite loops
+    rb'for\s+.*\s+in\s+range\s*\(\s*10000',  # Large loops
+    rb'time\.sleep\s*\(\s*[1-9]',  # Long sleeps
+    rb'recursive.*factorial',  # Inefficient recursion
+])
+
+# Decision points counted once each for McCabe complexity (match/try* only exist on newer Pythons)
+_BRANCH_NODES = tuple(
+    getattr(ast, name) for name in
+    ('If', 'For', 'AsyncFor', 'While', 'Try', 'TryStar', 'ExceptHandler', 'IfExp', 'match_case')
+    if hasattr(ast, name)
+)
+# Security issue types decided from the AST for Python sources instead of the text patterns
+_AST_SECURITY_TYPES = frozenset({
+    "dangerous_eval", "dangerous_exec", "dangerous_input", "dangerous_pickle", "dangerous_shell", "dangerous_subprocess"
+})
+_DANGEROUS_BUILTINS = {"eval": "dangerous_eval", "exec": "dangerous_exec", "input": "dangerous_input"}
+
+def _dangerous_call_types(call: ast.Call) -> Set[str]:
+    """Security issue types raised by a single call expression"""
+    found = set()
+    func = call.func
+    if isinstance(func, ast.Name) and func.id in _DANGEROUS_BUILTINS:
+        found.add(_DANGEROUS_BUILTINS[func.id])
+    elif isinstance(func, ast.Attribute) and isinstance(func.value, ast.Name):
+        if func.value.id == "pickle" and func.attr == "loads":
+            found.add("dangerous_pickle")
+    
+    for keyword in call.keywords:
+        if keyword.arg == "shell" and isinstance(keyword.value, ast.Constant) and keyword.value.value is True:
+            found.add("dangerous_shell")
+            if isinstance(func, ast.Attribute) and isinstance(func.value, ast.Name) and func.value.id == "subprocess":
+                found.add("dangerous_subprocess")
+    return found
+
+def _analyze_python_ast(content: str) -> Optional[Dict[str, Any]]:
+    """Complexity, function count and dangerous calls from one walk of the Python AST"""
+    try:
+        tree = ast.parse(content)
+    except (SyntaxError, ValueError, RecursionError):
+        return None  # Not parseable Python; callers fall back to the text patterns
+    
+    complexity = 1
+    functions = 0
+    security = {}  # issue type -> first line it occurs on
+    for node in ast.walk(tree):
+        if isinstance(node, _BRANCH_NODES):
+            complexity += 1
+        elif isinstance(node, ast.BoolOp):
+            complexity += len(node.values) - 1
+        elif isinstance(node, ast.comprehension):
+            complexity += len(node.ifs)
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            functions += 1
+        elif isinstance(node, ast.Call):
+            for issue_type in _dangerous_call_types(node):
+                # ast.walk is breadth-first, so keep the smallest line seen
+                security[issue_type] = min(security.get(issue_type, node.lineno), node.lineno)
+    
+    return {'tree': tree, 'complexity': complexity, 'functions': functions, 'security': security}
+
+def _section_patterns(section: str) -> List[str]:
+    """Heading patterns for a documentation section name"""
+    return [
+        rf'#{{1,6}}\s*{section}',
+        rf'## {section}',
+        rf'{section}:',
+        rf'{section}\n[=-]+'
+    ]
+
+@lru_cache(maxsize=64)
+def _section_re(section: str) -> re.Pattern:
+    """Compiled heading pattern for a documentation section name"""
+    return _any_of(_section_patterns(section), re.IGNORECASE)
+
+# Sections scored for documentation completeness, matched in one pass with a named group per
+# section. No section name occurs inside another's heading, so matches can't hide each other.
+_REQUIRED_DOC_SECTIONS = ("overview", "usage", "examples", "installation", "configuration")
+_DOC_SECTIONS_RE = re.compile('|'.join(
+    f"(?P<{section}>{'|'.join(f'(?:{p})' for p in _section_patterns(section))})"
+    for section in _REQUIRED_DOC_SECTIONS
+).encode(), re.IGNORECASE)
+
+@lru_cache(maxsize=_CONTENT_CACHE_SIZE)
+def _content_has_error_handling(content: str) -> bool:
+    """Whether code has error handling"""
+    return _ERROR_HANDLING_RE.search(_content_bytes(content)) is not None
+
+@lru_cache(maxsize=_CONTENT_CACHE_SIZE)
+def _content_has_logging(content: str) -> bool:
+    """Whether code has logging"""
+    return _LOGGING_RE.search(_content_bytes(content)) is not None
+
+@lru_cache(maxsize=_CONTENT_CACHE_SIZE)
+def _content_has_documentation(content: str) -> bool:
+    """Whether code has documentation"""
+    return _DOC_RE.search(_content_bytes(content)) is not None
+
+@lru_cache(maxsize=_CONTENT_CACHE_SIZE)
+def _content_complexity(content: str) -> int:
+    """Simplified McCabe complexity of code"""
+    complexity = 1  # Base complexity
+    data = _content_bytes(content)
+    
+    # Only run the word-boundary regex for keywords that appear at all
+    lowered = data.lower()
+    keywords = tuple(keyword for keyword in _COMPLEXITY_KEYWORDS if keyword in lowered)
+    if keywords:
+        complexity += len(_complexity_keywords_re(keywords).findall(data))
+    
+    # Operators are plain text, so substring counts are exact
+    complexity += data.count(b'||') + data.count(b'&&')
+    if b'?' in data:
+        complexity += len(_TERNARY_RE.findall(data))
+    
+    return complexity
+
+@lru_cache(maxsize=_CONTENT_CACHE_SIZE)
+def _content_separates_concerns(content: str) -> bool:
+    """Whether code mixes at most two concerns"""
+    # Simplified check - look for mixed responsibilities
+    data = _content_bytes(content)
+    found_concerns = sum(1 for concern in _CONCERN_RES if concern.search(data))
+    
+    # If more than 2 concerns in one file, might violate separation
+    return found_concerns <= 2
+
+@lru_cache(maxsize=_CONTENT_CACHE_SIZE)
+def _content_has_single_responsibility(content: str) -> bool:
+    """Whether code defines few enough functions for a single responsibility"""
+    # Count the number of class methods or functions
+    class_methods = len(_FUNCTION_DEF_RE.findall(_content_bytes(content)))
+    
+    # If too many methods, might violate single responsibility
+    return class_methods <= 10
+
+# Reviews of smaller files are cheaper than hashing and caching them
+_REVIEW_CACHE_MIN_CHARS = 1024
+# Below this much content per batch, pickling to a worker process costs more than the review
+_REVIEW_POOL_MIN_CHARS = 64 * 1024
+# Shared review results in Redis; the jitter keeps entries written together from expiring together
+_REVIEW_REDIS_TTL = 3600
+_REVIEW_REDIS_TTL_JITTER = 300
+_REVIEW_REDIS_RETRY_SECONDS = 60
+# How long a located coverage data file is trusted before looking for it again
+_COVERAGE_TTL_SECONDS = 60
+
+def _find_coverage_data(directory: str) -> Optional[str]:
+    """Nearest coverage.py data file in directory or its parents"""
+    while True:
+        data_file = os.path.join(directory, ".coverage")
+        if os.path.isfile(data_file):
+            return data_file
+        parent = os.path.dirname(directory)
+        if parent == directory:
+            return None
+        directory = parent
+
+def _load_coverage(data_file: str):
+    """coverage.py measurements loaded from a data file"""
+    cov = coverage.Coverage(data_file=data_file)
+    cov.load()
+    return cov
+
+def _file_coverage(cov, source: str) -> Optional[float]:
+    """Fraction of a source file's statements that ran, or None if it wasn't measured"""
+    if source not in cov.get_data().measured_files():
+        return None
+    _, statements, _, missing, _ = cov.analysis2(source)
+    return 1.0 - len(missing) / len(statements) if statements else 1.0
 
 class QualityReviewEngine:
     """Engine for performing quality reviews"""
     
-    def __init__(self):
+    def __init__(self, redis_client: Optional[redis.Redis] = None):
         self.quality_standards = {
             WorkType.CODE: {
                 "min_quality_score": 0.8,
@@ -152,43 +559,218 @@ class QualityReviewEngine:
                 "max_coupling": 0.3
             }
         }
-        
+        # LRU of (work type, path, content digest, coverage data stamp) -> (issues, metrics) for unchanged resubmissions
+        self.review_cache_size = 4096
+        self._review_cache: OrderedDict = OrderedDict()
+        # Second-level cache shared by every reviewer process; skipped for a while after a Redis error
+        self.redis_client = redis_client
+        self._redis_retry_at = 0.0
+        # Work-type specific reviewers, bound once instead of dispatched through a branch chain per review
+        self._reviewers = {
+            WorkType.CODE: self._review_code_quality,
+            WorkType.DOCUMENTATION: self._review_documentation,
+            WorkType.TESTS: self._review_tests,
+            WorkType.ARCHITECTURE: self._review_architecture
+        }
+        # Worker pool for CPU-bound review analysis, created on first use
+        self.review_executor: Optional[ProcessPoolExecutor] = None
+        self.review_batch_size = 16
+        # Coverage data file per directory with an expiry time, and loaded measurements per data file
+        # with the (mtime_ns, size) they were loaded at
+        self._coverage_files: Dict[str, Tuple[float, Optional[str]]] = {}
+        self._coverage_cache: Dict[str, Tuple[Tuple[int, int], Any, Dict[str, Optional[float]]]] = {}
+        
+    def shutdown(self, wait: bool = True):
+        """Stop the review worker pool, if one was started"""
+        if self.review_executor is not None:
+            self.review_executor.shutdown(wait=wait, cancel_futures=True)
+            self.review_executor = None
+    
     async def review_work_item(self, work_item: WorkItem) -> Tuple[QualityStandard, List[QualityIssue]]:
         """Perform comprehensive quality review"""
-        issues = []
+        return (await self.review_work_items([work_item]))[0]
+    
+    async def review_work_items(self, work_items: List[WorkItem]) -> List[Tuple[QualityStandard, List[QualityIssue]]]:
+        """Review several work items, analysing the uncached ones in batches across CPU cores"""
+        results = {}
+        pending = []
+        local_misses = []
+        for index, work_item in enumerate(work_items):
+            if len(work_item.content) < _REVIEW_CACHE_MIN_CHARS:
+                pending.append((index, work_item, None))
+                continue
+            # Coverage data changes independently of the file, so its stamp is part of the key
+            _, coverage_stamp = await self._coverage_data(work_item.file_path)
+            cache_key = (work_item.work_type, work_item.file_path, work_item.content_digest(), coverage_stamp)
+            cached = self._review_cache.get(cache_key)
+            if cached is None:
+                local_misses.append((index, work_item, cache_key))
+                continue
+            self._review_cache.move_to_end(cache_key)
+            results[index] = self._cached_review(work_item, cached)
+        
+        # Everything missing locally is looked up in the shared cache in one round trip
+        shared = await self._load_shared_reviews([cache_key for _, _, cache_key in local_misses])
+        for (index, work_item, cache_key), cached in zip(local_misses, shared):
+            if cached is None:
+                pending.append((index, work_item, cache_key))
+                continue
+            self._remember_review(cache_key, cached)
+            results[index] = self._cached_review(work_item, cached)
         
-        # Perform specific reviews based on work type
-        if work_item.work_type == WorkType.CODE:
-            code_issues = await self._review_code_quality(work_item)
-            issues.extend(code_issues)
-            
-        elif work_item.work_type == WorkType.DOCUMENTATION:
-            doc_issues = await self._review_documentation(work_item)
-            issues.extend(doc_issues)
+        analyses = await self._analyze_work_items([work_item for _, work_item, _ in pending])
+        
+        to_share = []
+        for (index, work_item, cache_key), (issues, metrics, python_analysis) in zip(pending, analyses):
+            work_item.quality_metrics = metrics
+            work_item.python_analysis = python_analysis
             
-        elif work_item.work_type == WorkType.TESTS:
-            test_issues = await self._review_tests(work_item)
-            issues.extend(test_issues)
+            # Determine quality standard
+            quality_standard = self._determine_quality_standard(work_item)
             
-        elif work_item.work_type == WorkType.ARCHITECTURE:
-            arch_issues = await self._review_architecture(work_item)
-            issues.extend(arch_issues)
+            if cache_key is not None:
+                self._remember_review(cache_key, ([replace(issue) for issue in issues], replace(metrics)))
+                to_share.append((cache_key, issues, metrics))
             
+            results[index] = (quality_standard, issues)
+        
+        await self._store_shared_reviews(to_share)
+        return [results[index] for index in range(len(work_items))]
+    
+    def _cached_review(self, work_item: WorkItem, cached: Tuple[List[QualityIssue], QualityMetrics]) -> Tuple[QualityStandard, List[QualityIssue]]:
+        """Apply a cached review to a work item, handing out copies so the cache stays untouched"""
+        cached_issues, cached_metrics = cached
+        work_item.quality_metrics = replace(cached_metrics)
+        return self._determine_quality_standard(work_item), [replace(issue) for issue in cached_issues]
+    
+    def _remember_review(self, cache_key: Tuple[WorkType, str, bytes, Optional[Tuple[int, int]]], review: Tuple[List[QualityIssue], QualityMetrics]):
+        """Add a review to the local LRU cache"""
+        self._review_cache[cache_key] = review
+        self._review_cache.move_to_end(cache_key)
+        if len(self._review_cache) > self.review_cache_size:
+            self._review_cache.popitem(last=False)
+    
+    async def _analyze_work_items(self, work_items: List[WorkItem]) -> List[Tuple[List[QualityIssue], QualityMetrics, Optional[Dict[str, Any]]]]:
+        """Issues, metrics and Python analysis per work item, on the process pool unless the batch is small"""
+        if not work_items:
+            return []
+        
+        for work_item in work_items:
+            work_item.python_analysis = None  # Recomputed by the worker; don't pickle the old tree
+        
+        if sum(len(work_item.content) for work_item in work_items) < _REVIEW_POOL_MIN_CHARS:
+            # Not worth pickling, but still kept off the event loop
+            analysed_batches = [await asyncio.to_thread(_analyze_work_items_in_worker, work_items)]
+        else:
+            if self.review_executor is None:
+                self.review_executor = ProcessPoolExecutor(max_workers=os.cpu_count())
+            loop = asyncio.get_running_loop()
+            batches = [work_items[i:i + self.review_batch_size] for i in range(0, len(work_items), self.review_batch_size)]
+            try:
+                analysed_batches = await asyncio.gather(*[
+                    loop.run_in_executor(self.review_executor, _analyze_work_items_in_worker, batch) for batch in batches
+                ])
+            except Exception as e:
+                # A broken pool or an unpicklable work item falls back to reviewing in a thread
+                logger.warning(f"Parallel review unavailable, reviewing in-process: {e}")
+                self.shutdown(wait=False)
+                analysed_batches = [await asyncio.to_thread(_analyze_work_items_in_worker, work_items)]
+        
+        analyses = []
+        for result, error in (item for batch in analysed_batches for item in batch):
+            if error is not None:
+                raise error
+            analyses.append(result)
+        return analyses
+    
+    async def _analyze_work_item(self, work_item: WorkItem) -> Tuple[List[QualityIssue], QualityMetrics, Optional[Dict[str, Any]]]:
+        """Run every review check for one work item"""
+        issues = []
+        
+        # Python sources get one AST pass that the later checks reuse; everything else uses the text patterns
+        work_item.python_analysis = work_item.ast_analysis() if work_item.file_path.endswith('.py') else None
+        
+        # Perform specific reviews based on work type
+        reviewer = self._reviewers.get(work_item.work_type)
+        if reviewer:
+            issues.extend(await reviewer(work_item))
+        
         # Calculate overall quality metrics
         await self._calculate_quality_metrics(work_item)
         
-        # Determine quality standard
-        quality_standard = self._determine_quality_standard(work_item)
-        
-        return quality_standard, issues
+        return issues, work_item.quality_metrics, work_item.python_analysis
+    
+    def _shared_reviews_available(self) -> bool:
+        """Whether to use Redis: configured, and not backing off after an error"""
+        return self.redis_client is not None and time.monotonic() >= self._redis_retry_at
+    
+    def _shared_reviews_failed(self, error: Exception):
+        """Stop using Redis for a while after an error"""
+        logger.warning(f"Shared review cache unavailable: {error}")
+        self._redis_retry_at = time.monotonic() + _REVIEW_REDIS_RETRY_SECONDS
+    
+    def _shared_review_key(self, cache_key: Tuple[WorkType, str, bytes, Optional[Tuple[int, int]]]) -> str:
+        """Redis key for a review cache key"""
+        work_type, file_path, digest, coverage_stamp = cache_key
+        path_digest = hashlib.blake2b(file_path.encode('utf-8', 'surrogatepass'), digest_size=8).hexdigest()
+        coverage_tag = f"{coverage_stamp[0]}-{coverage_stamp[1]}" if coverage_stamp else "none"
+        return f"qc:review:{work_type.value}:{path_digest}:{digest.hex()}:{coverage_tag}"
+    
+    async def _load_shared_reviews(self, cache_keys: List[Tuple[WorkType, str, bytes, Optional[Tuple[int, int]]]]) -> List[Optional[Tuple[List[QualityIssue], QualityMetrics]]]:
+        """Fetch reviews other reviewers already stored in Redis, with one MGET"""
+        if not cache_keys or not self._shared_reviews_available():
+            return [None] * len(cache_keys)
+        try:
+            payloads = await asyncio.to_thread(
+                self.redis_client.mget, [self._shared_review_key(cache_key) for cache_key in cache_keys]
+            )
+        except redis.RedisError as e:
+            self._shared_reviews_failed(e)
+            return [None] * len(cache_keys)
+        
+        reviews = []
+        for cache_key, payload in zip(cache_keys, payloads):
+            if payload is None:
+                reviews.append(None)
+                continue
+            # Entries written by an older or broken reviewer are treated as misses and overwritten
+            try:
+                data = json.loads(payload)
+                issues = [QualityIssue(**issue) for issue in data["issues"]]
+                reviews.append((issues, QualityMetrics(**data["metrics"])))
+            except (ValueError, TypeError, KeyError) as e:
+                logger.debug(f"Ignoring unreadable shared review {self._shared_review_key(cache_key)}: {e}")
+                reviews.append(None)
+        return reviews
+    
+    async def _store_shared_reviews(self, reviews: List[Tuple[Tuple[WorkType, str, bytes, Optional[Tuple[int, int]]], List[QualityIssue], QualityMetrics]]):
+        """Publish reviews to Redis for other reviewers, pipelined into one round trip"""
+        if not reviews or not self._shared_reviews_available():
+            return
+        pipe = self.redis_client.pipeline(transaction=False)
+        for cache_key, issues, metrics in reviews:
+            # Issue timestamps are not shared; a restored issue is stamped when it is loaded
+            payload = json.dumps({
+                "issues": [
+                    {name: value for name, value in asdict(issue).items() if name != "timestamp"}
+                    for issue in issues
+                ],
+                "metrics": asdict(metrics)
+            })
+            pipe.setex(self._shared_review_key(cache_key), _REVIEW_REDIS_TTL + random.randint(0, _REVIEW_REDIS_TTL_JITTER), payload)
+        try:
+            await asyncio.to_thread(pipe.execute)
+        except redis.RedisError as e:
+            self._shared_reviews_failed(e)
     
     async def _review_code_quality(self, work_item: WorkItem) -> List[QualityIssue]:
         """Review code quality specifically"""
         issues = []
         content = work_item.content
+        signals = self._scan_code(content, work_item.python_analysis)
         
         # Check for basic code quality issues
-        if not self._has_error_handling(content):
+        if not signals['error_handling']:
             issues.append(QualityIssue(
                 issue_type="missing_error_handling",
                 severity="high",
@@ -198,7 +780,7 @@ class QualityReviewEngine:
                 auto_fixable=True
             ))
         
-        if not self._has_logging(content):
+        if not signals['logging']:
             issues.append(QualityIssue(
                 issue_type="missing_logging",
                 severity="medium",
@@ -208,7 +790,7 @@ class QualityReviewEngine:
                 auto_fixable=True
             ))
         
-        if not self._has_documentation(content):
+        if not signals['documentation']:
             issues.append(QualityIssue(
                 issue_type="missing_documentation",
                 severity="medium",
@@ -219,7 +801,7 @@ class QualityReviewEngine:
             ))
         
         # Check complexity
-        complexity = self._calculate_complexity(content)
+        complexity = signals['complexity']
         if complexity > self.quality_standards[WorkType.CODE]["max_complexity"]:
             issues.append(QualityIssue(
                 issue_type="high_complexity",
@@ -231,7 +813,7 @@ class QualityReviewEngine:
             ))
         
         # Check for security issues
-        security_issues = await self._check_security_issues(content)
+        security_issues = await self._check_security_issues(content, work_item.python_analysis)
         issues.extend(security_issues)
         
         return issues
@@ -310,7 +892,7 @@ class QualityReviewEngine:
         required_patterns = self.quality_standards[WorkType.ARCHITECTURE]["required_patterns"]
         
         for pattern in required_patterns:
-            if not self._follows_pattern(content, pattern):
+            if not self._follows_pattern(content, pattern, work_item.python_analysis):
                 issues.append(QualityIssue(
                     issue_type="missing_pattern",
                     severity="medium",
@@ -322,103 +904,53 @@ class QualityReviewEngine:
         
         return issues
     
+    def _scan_code(self, content: str, analysis: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Code-quality signals from one scan per pattern family"""
+        return {
+            'error_handling': self._has_error_handling(content),
+            'logging': self._has_logging(content),
+            'documentation': self._has_documentation(content),
+            # The AST count ignores keywords inside strings and comments
+            'complexity': analysis['complexity'] if analysis else self._calculate_complexity(content)
+        }
+    
     def _has_error_handling(self, content: str) -> bool:
         """Check if code has proper error handling"""
-        error_patterns = [
-            r'try\s*:',
-            r'except\s+\w+',
-            r'catch\s*\(',
-            r'throw\s+',
-            r'raise\s+',
-            r'error\s*\(',
-            r'Error\s*\('
-        ]
-        
-        for pattern in error_patterns:
-            if re.search(pattern, content, re.IGNORECASE):
-                return True
-        return False
+        return _content_has_error_handling(content)
     
     def _has_logging(self, content: str) -> bool:
         """Check if code has proper logging"""
-        logging_patterns = [
-            r'logger\.',
-            r'log\.',
-            r'console\.log',
-            r'print\s*\(',
-            r'logging\.',
-            r'log\s*\('
-        ]
-        
-        for pattern in logging_patterns:
-            if re.search(pattern, content, re.IGNORECASE):
-                return True
-        return False
+        return _content_has_logging(content)
     
     def _has_documentation(self, content: str) -> bool:
         """Check if code has proper documentation"""
-        doc_patterns = [
-            r'""".*?"""',
-            r"'''.*?'''",
-            r'/\*\*.*?\*/',
-            r'//.*',
-            r'#.*'
-        ]
-        
-        for pattern in doc_patterns:
-            if re.search(pattern, content, re.DOTALL):
-                return True
-        return False
+        return _content_has_documentation(content)
     
     def _calculate_complexity(self, content: str) -> int:
         """Calculate code complexity (simplified McCabe complexity)"""
-        complexity = 1  # Base complexity
-        
-        complexity_patterns = [
-            r'\bif\b',
-            r'\belse\b',
-            r'\belif\b',
-            r'\bwhile\b',
-            r'\bfor\b',
-            r'\btry\b',
-            r'\bexcept\b',
-            r'\bcase\b',
-            r'\bswitch\b',
-            r'\b\?\s*.*\s*:\s*',  # ternary operator
-            r'\band\b',
-            r'\bor\b',
-            r'\|\|',
-            r'\&\&'
-        ]
-        
-        for pattern in complexity_patterns:
-            complexity += len(re.findall(pattern, content, re.IGNORECASE))
-        
-        return complexity
+        return _content_complexity(content)
     
-    async def _check_security_issues(self, content: str) -> List[QualityIssue]:
+    async def _check_security_issues(self, content: str, analysis: Optional[Dict[str, Any]] = None) -> List[QualityIssue]:
         """Check for security issues in code"""
         issues = []
-        
-        # Common security anti-patterns
-        security_patterns = [
-            (r'eval\s*\(', "dangerous_eval", "Use of eval() function is dangerous"),
-            (r'exec\s*\(', "dangerous_exec", "Use of exec() function is dangerous"),
-            (r'input\s*\(', "dangerous_input", "Direct user input without validation"),
-            (r'pickle\.loads', "dangerous_pickle", "Pickle deserialization is dangerous"),
-            (r'shell=True', "dangerous_shell", "Shell injection vulnerability"),
-            (r'subprocess\.\w+.*shell=True', "dangerous_subprocess", "Subprocess with shell=True is dangerous"),
-            (r'password\s*=\s*["\'].*["\']', "hardcoded_password", "Hardcoded password detected"),
-            (r'api_key\s*=\s*["\'].*["\']', "hardcoded_api_key", "Hardcoded API key detected"),
-            (r'secret\s*=\s*["\'].*["\']', "hardcoded_secret", "Hardcoded secret detected"),
-        ]
-        
-        for pattern, issue_type, description in security_patterns:
-            if re.search(pattern, content, re.IGNORECASE):
+        found_at = dict(_security_matches(content))
+        
+        # Report in pattern order, whichever order the scan found them in
+        for index, (_, issue_type, description) in enumerate(_SECURITY_PATTERNS):
+            if analysis and issue_type in _AST_SECURITY_TYPES:
+                # Calls are judged from the AST, so mentions in strings, comments or e.g. model.eval() don't count
+                line_number = analysis['security'].get(issue_type)
+            elif index in found_at:
+                line_number = _line_number(content, found_at[index])
+            else:
+                line_number = None
+            
+            if line_number is not None:
                 issues.append(QualityIssue(
                     issue_type=issue_type,
                     severity="critical",
                     description=description,
+                    line_number=line_number,
                     suggested_fix=f"Remove or properly secure {issue_type.replace('_', ' ')}",
                     auto_fixable=False
                 ))
@@ -427,21 +959,11 @@ class QualityReviewEngine:
     
     def _has_section(self, content: str, section: str) -> bool:
         """Check if documentation has required section"""
-        section_patterns = [
-            rf'#{1,6}\s*{section}',
-            rf'## {section}',
-            rf'{section}:',
-            rf'{section}\n[=-]+'
-        ]
-        
-        for pattern in section_patterns:
-            if re.search(pattern, content, re.IGNORECASE):
-                return True
-        return False
+        return _section_re(section).search(_content_bytes(content)) is not None
     
     def _calculate_readability(self, content: str) -> float:
         """Calculate readability score (simplified Flesch Reading Ease)"""
-        sentences = len(re.findall(r'[.!?]+', content))
+        sentences = len(_SENTENCE_END_RE.findall(_content_bytes(content)))
         words = len(content.split())
         syllables = self._count_syllables(content)
         
@@ -459,40 +981,25 @@ class QualityReviewEngine:
     
     def _count_syllables(self, text: str) -> int:
         """Count syllables in text (simplified)"""
-        vowels = "aeiouy"
-        syllables = 0
-        prev_was_vowel = False
-        
-        for char in text.lower():
-            if char in vowels:
-                if not prev_was_vowel:
-                    syllables += 1
-                prev_was_vowel = True
-            else:
-                prev_was_vowel = False
-        
-        return max(1, syllables)
+        # Each run of consecutive vowels starts one syllable. Vowels are ASCII,
+        # so other characters can become '?' without changing the count
+        marks = text.lower().encode('ascii', 'replace').translate(_VOWEL_TABLE)
+        return max(1, marks.count(b' a') + marks.startswith(b'a'))
     
     def _has_test_type(self, content: str, test_type: str) -> bool:
         """Check if tests include specific test type"""
-        test_patterns = {
-            "unit": [r'test_\w+', r'unittest', r'describe\s*\(', r'it\s*\('],
-            "integration": [r'integration.*test', r'test.*integration', r'e2e.*test'],
-            "performance": [r'performance.*test', r'benchmark', r'load.*test'],
-            "security": [r'security.*test', r'test.*security', r'vulnerability.*test']
-        }
-        
-        patterns = test_patterns.get(test_type, [])
-        
-        for pattern in patterns:
-            if re.search(pattern, content, re.IGNORECASE):
-                return True
-        return False
+        pattern = _TEST_TYPE_RES.get(test_type)
+        return pattern is not None and pattern.search(_content_bytes(content)) is not None
     
     async def _calculate_test_coverage(self, file_path: str) -> float:
-        """Calculate test coverage (simplified)"""
+        """Calculate test coverage from the project's coverage data, or estimate it"""
         try:
-            # This is a simplified version - in practice, you'd integrate with coverage tools
+            if coverage is not None:
+                measured = await self._measured_coverage(file_path)
+                if measured is not None:
+                    return measured
+            
+            # Estimate when the file has no coverage data
             if "test" in file_path.lower():
                 return 0.9  # Assume test files have high coverage
             else:
@@ -500,8 +1007,50 @@ class QualityReviewEngine:
         except Exception:
             return 0.0
     
-    def _follows_pattern(self, content: str, pattern: str) -> bool:
+    async def _coverage_data(self, file_path: str) -> Tuple[Optional[str], Optional[Tuple[int, int]]]:
+        """Nearest .coverage data file for a source file and its (mtime_ns, size); located at most every _COVERAGE_TTL_SECONDS"""
+        if coverage is None:
+            return None, None
+        now = time.monotonic()
+        directory = os.path.dirname(os.path.abspath(file_path))
+        
+        located = self._coverage_files.get(directory)
+        if located is None or located[0] <= now:
+            located = (now + _COVERAGE_TTL_SECONDS, await asyncio.to_thread(_find_coverage_data, directory))
+            self._coverage_files[directory] = located
+        data_file = located[1]
+        if data_file is None:
+            return None, None
+        
+        try:
+            st = os.stat(data_file)
+        except OSError:
+            return None, None
+        return data_file, (st.st_mtime_ns, st.st_size)
+    
+    async def _measured_coverage(self, file_path: str) -> Optional[float]:
+        """Line coverage of a file from the nearest .coverage data, reloaded whenever the data file changes"""
+        source = os.path.abspath(file_path)
+        data_file, stamp = await self._coverage_data(source)
+        if data_file is None:
+            return None
+        
+        loaded = self._coverage_cache.get(data_file)
+        if loaded is None or loaded[0] != stamp:
+            loaded = (stamp, await asyncio.to_thread(_load_coverage, data_file), {})
+            self._coverage_cache[data_file] = loaded
+        _, cov, by_file = loaded
+        
+        if source not in by_file:
+            by_file[source] = await asyncio.to_thread(_file_coverage, cov, source)
+        return by_file[source]
+    
+    def _follows_pattern(self, content: str, pattern: str, analysis: Optional[Dict[str, Any]] = None) -> bool:
         """Check if code follows architectural pattern"""
+        if pattern == "single_responsibility" and analysis:
+            # Real function definitions only, not "def name" text in strings
+            return analysis['functions'] <= 10
+        
         pattern_checks = {
             "separation_of_concerns": self._check_separation_of_concerns,
             "single_responsibility": self._check_single_responsibility,
@@ -516,93 +1065,65 @@ class QualityReviewEngine:
     
     def _check_separation_of_concerns(self, content: str) -> bool:
         """Check for separation of concerns"""
-        # Simplified check - look for mixed responsibilities
-        concerns = ["database", "ui", "business", "validation", "logging"]
-        found_concerns = []
-        
-        for concern in concerns:
-            if re.search(concern, content, re.IGNORECASE):
-                found_concerns.append(concern)
-        
-        # If more than 2 concerns in one file, might violate separation
-        return len(found_concerns) <= 2
+        return _content_separates_concerns(content)
     
     def _check_single_responsibility(self, content: str) -> bool:
         """Check for single responsibility principle"""
-        # Count the number of class methods or functions
-        class_methods = len(re.findall(r'def\s+\w+', content))
-        
-        # If too many methods, might violate single responsibility
-        return class_methods <= 10
+        return _content_has_single_responsibility(content)
     
     def _check_dependency_injection(self, content: str) -> bool:
         """Check for dependency injection pattern"""
         # Look for constructor injection patterns
-        injection_patterns = [
-            r'__init__\s*\([^)]+\)',
-            r'constructor\s*\([^)]+\)',
-            r'@inject',
-            r'dependencies\s*='
-        ]
-        
-        for pattern in injection_patterns:
-            if re.search(pattern, content, re.IGNORECASE):
-                return True
-        return False
+        return _INJECTION_RE.search(_content_bytes(content)) is not None
     
     def _check_factory_pattern(self, content: str) -> bool:
         """Check for factory pattern"""
-        factory_patterns = [
-            r'class\s+\w+Factory',
-            r'def\s+create_\w+',
-            r'factory\s*\(',
-            r'Factory\s*\('
-        ]
-        
-        for pattern in factory_patterns:
-            if re.search(pattern, content, re.IGNORECASE):
-                return True
-        return False
+        return _FACTORY_RE.search(_content_bytes(content)) is not None
     
     async def _calculate_quality_metrics(self, work_item: WorkItem):
         """Calculate comprehensive quality metrics"""
         content = work_item.content
+        analysis = work_item.python_analysis
         
         # Code quality metrics
-        work_item.quality_metrics.code_quality = self._calculate_code_quality_score(content)
+        work_item.quality_metrics.code_quality = self._calculate_code_quality_score(content, analysis)
         
         # Test coverage
         work_item.quality_metrics.test_coverage = await self._calculate_test_coverage(work_item.file_path)
         
         # Documentation completeness
-        work_item.quality_metrics.documentation_completeness = self._calculate_documentation_completeness(content)
+        if work_item.work_type is WorkType.DOCUMENTATION:
+            work_item.quality_metrics.documentation_completeness = self._calculate_documentation_completeness(work_item)
+        else:
+            work_item.quality_metrics.documentation_completeness = 0.8  # Default for non-documentation work
         
         # Security score
-        security_issues = await self._check_security_issues(content)
+        security_issues = await self._check_security_issues(content, analysis)
         work_item.quality_metrics.security_score = max(0, 1.0 - (len(security_issues) * 0.2))
         
         # Performance score (simplified)
         work_item.quality_metrics.performance_score = self._calculate_performance_score(content)
         
         # Architecture compliance
-        work_item.quality_metrics.architecture_compliance = self._calculate_architecture_compliance(content)
+        work_item.quality_metrics.architecture_compliance = self._calculate_architecture_compliance(content, analysis)
         
         # Calculate overall score
         work_item.quality_metrics.calculate_overall_score()
     
-    def _calculate_code_quality_score(self, content: str) -> float:
+    def _calculate_code_quality_score(self, content: str, analysis: Optional[Dict[str, Any]] = None) -> float:
         """Calculate code quality score"""
         score = 1.0
+        signals = self._scan_code(content, analysis)
         
         # Deduct points for issues
-        if not self._has_error_handling(content):
+        if not signals['error_handling']:
             score -= 0.2
-        if not self._has_logging(content):
+        if not signals['logging']:
             score -= 0.1
-        if not self._has_documentation(content):
+        if not signals['documentation']:
             score -= 0.1
         
-        complexity = self._calculate_complexity(content)
+        complexity = signals['complexity']
         if complexity > 10:
             score -= 0.3
         elif complexity > 5:
@@ -610,35 +1131,25 @@ class QualityReviewEngine:
         
         return max(0, score)
     
-    def _calculate_documentation_completeness(self, content: str) -> float:
+    def _calculate_documentation_completeness(self, work_item: WorkItem) -> float:
         """Calculate documentation completeness score"""
-        if work_item.work_type != WorkType.DOCUMENTATION:
-            return 0.8  # Default for non-documentation work
+        found_sections = {match.lastgroup for match in _DOC_SECTIONS_RE.finditer(_content_bytes(work_item.content))}
         
-        required_sections = ["overview", "usage", "examples", "installation", "configuration"]
-        found_sections = sum(1 for section in required_sections if self._has_section(content, section))
-        
-        return found_sections / len(required_sections)
+        return len(found_sections) / len(_REQUIRED_DOC_SECTIONS)
     
     def _calculate_performance_score(self, content: str) -> float:
         """Calculate performance score"""
         score = 1.0
         
         # Check for performance anti-patterns
-        performance_issues = [
-            r'while\s+True\s*:',  # Infinite loops
-            r'for\s+.*\s+in\s+range\s*\(\s*10000',  # Large loops
-            r'time\.sleep\s*\(\s*[1-9]',  # Long sleeps
-            r'recursive.*factorial',  # Inefficient recursion
-        ]
-        
-        for pattern in performance_issues:
-            if re.search(pattern, content, re.IGNORECASE):
+        data = _content_bytes(content)
+        for pattern in _PERFORMANCE_ISSUE_RES:
+            if pattern.search(data):
                 score -= 0.2
         
         return max(0, score)
     
-    def _calculate_architecture_compliance(self, content: str) -> float:
+    def _calculate_architecture_compliance(self, content: str, analysis: Optional[Dict[str, Any]] = None) -> float:
         """Calculate architecture compliance score"""
         score = 1.0
         
@@ -646,7 +1157,7 @@ class QualityReviewEngine:
         patterns = ["separation_of_concerns", "single_responsibility"]
         
         for pattern in patterns:
-            if not self._follows_pattern(content, pattern):
+            if not self._follows_pattern(content, pattern, analysis):
                 score -= 0.2
         
         return max(0, score)
@@ -654,9 +1165,8 @@ class QualityReviewEngine:
     def _determine_quality_standard(self, work_item: WorkItem) -> QualityStandard:
         """Determine overall quality standard"""
         overall_score = work_item.quality_metrics.overall_score
-        critical_issues = len([i for i in work_item.issues if i.severity == "critical"])
         
-        if critical_issues > 0:
+        if any(issue.severity == "critical" for issue in work_item.issues):
             return QualityStandard.UNACCEPTABLE
         elif overall_score >= 0.9:
             return QualityStandard.EXCELLENT
@@ -669,6 +1179,37 @@ class QualityReviewEngine:
         else:
             return QualityStandard.UNACCEPTABLE
 
+# Per-process engine used by review pool workers
+_WORKER_ENGINE: Optional[QualityReviewEngine] = None
+
+def _analyze_work_items_in_worker(work_items: List[WorkItem]) -> List[Tuple[Optional[Tuple[List[QualityIssue], QualityMetrics, Optional[Dict[str, Any]]]], Optional[Exception]]]:
+    """Process pool entry point: (analysis, error) per work item, analysed by this process's engine"""
+    global _WORKER_ENGINE
+    if _WORKER_ENGINE is None:
+        _WORKER_ENGINE = QualityReviewEngine()
+    
+    async def analyze_all():
+        results = []
+        for work_item in work_items:
+            try:
+                issues, metrics, python_analysis = await _WORKER_ENGINE._analyze_work_item(work_item)
+            except Exception as e:
+                results.append((None, e))
+                continue
+            # Syntax trees are costly to send back; callers only need the summary
+            if python_analysis is not None:
+                python_analysis = {key: value for key, value in python_analysis.items() if key != 'tree'}
+            results.append(((issues, metrics, python_analysis), None))
+        return results
+    
+    return asyncio.run(analyze_all())
+
+# Start of a function definition line, as matched by the auto-fix routines
+_DEF_LINE_RE = re.compile(r'\s*def\s+')
+# What to add, read back from the issue descriptions the reviewers write
+_MISSING_SECTION_RE = re.compile(r'section:\s+(\w+)')
+_MISSING_TEST_RE = re.compile(r'Missing\s+(\w+)\s+tests')
+
 class AutoFixEngine:
     """Engine for automatically fixing quality issues"""
     
@@ -691,41 +1232,48 @@ class AutoFixEngine:
             return False
         
         try:
-            fixed_content = await fix_function(work_item.content, issue)
+            fixed_content = await fix_function(work_item, issue)
             if fixed_content != work_item.content:
                 work_item.content = fixed_content
-                logger.info(f"Auto-fixed issue: {issue.issue_type} in {work_item.file_path}")
+                logger.info("Auto-fixed issue: %s in %s", issue.issue_type, work_item.file_path)
                 return True
         except Exception as e:
             logger.error(f"Failed to auto-fix {issue.issue_type}: {str(e)}")
         
         return False
     
-    async def _fix_missing_error_handling(self, content: str, issue: QualityIssue) -> str:
+    async def _fix_missing_error_handling(self, work_item: WorkItem, issue: QualityIssue) -> str:
         """Add basic error handling to code"""
+        content = work_item.content
         if "def " in content:
             # Add try-catch around function bodies
-            lines = content.split('\n')
+            lines = work_item.lines()
             fixed_lines = []
             in_function = False
             indent_level = 0
             
             for line in lines:
-                if re.match(r'\s*def\s+', line):
+                stripped = line.lstrip()
+                if _DEF_LINE_RE.match(line):
                     in_function = True
-                    indent_level = len(line) - len(line.lstrip())
+                    indent_level = len(line) - len(stripped)
+                    # Indents for this function, built once rather than per line
+                    pad4 = ' ' * (indent_level + 4)
+                    pad8 = ' ' * (indent_level + 8)
                     fixed_lines.append(line)
-                elif in_function and line.strip() and not line.startswith(' ' * (indent_level + 4)):
+                elif in_function and stripped and not line.startswith(pad4):
                     # End of function
                     in_function = False
                     fixed_lines.append(line)
-                elif in_function and line.strip() and not line.strip().startswith('try:'):
+                elif in_function and stripped and not stripped.startswith('try:'):
                     # Add try-catch
-                    fixed_lines.append(' ' * (indent_level + 4) + 'try:')
-                    fixed_lines.append(' ' * (indent_level + 8) + line.lstrip())
-                    fixed_lines.append(' ' * (indent_level + 4) + 'except Exception as e:')
-                    fixed_lines.append(' ' * (indent_level + 8) + 'logger.error(f"Error: {e}")')
-                    fixed_lines.append(' ' * (indent_level + 8) + 'raise')
+                    fixed_lines.extend((
+                        f'{pad4}try:',
+                        f'{pad8}{stripped}',
+                        f'{pad4}except Exception as e:',
+                        f'{pad8}logger.error(f"Error: {{e}}")',
+                        f'{pad8}raise'
+                    ))
                     in_function = False
                 else:
                     fixed_lines.append(line)
@@ -734,16 +1282,17 @@ class AutoFixEngine:
         
         return content
     
-    async def _fix_missing_logging(self, content: str, issue: QualityIssue) -> str:
+    async def _fix_missing_logging(self, work_item: WorkItem, issue: QualityIssue) -> str:
         """Add basic logging to code"""
+        content = work_item.content
         if "import logging" not in content:
             # Add logging import
-            lines = content.split('\n')
+            lines = work_item.lines()
             import_section = []
             other_lines = []
             
             for line in lines:
-                if line.startswith('import ') or line.startswith('from '):
+                if line.startswith(('import ', 'from ')):
                     import_section.append(line)
                 else:
                     other_lines.append(line)
@@ -755,29 +1304,27 @@ class AutoFixEngine:
         
         return content
     
-    async def _fix_missing_documentation(self, content: str, issue: QualityIssue) -> str:
+    async def _fix_missing_documentation(self, work_item: WorkItem, issue: QualityIssue) -> str:
         """Add basic documentation to code"""
+        content = work_item.content
         if "def " in content:
-            lines = content.split('\n')
+            lines = work_item.lines()
             fixed_lines = []
             
-            for i, line in enumerate(lines):
-                if re.match(r'\s*def\s+', line):
-                    fixed_lines.append(line)
-                    indent = len(line) - len(line.lstrip())
+            for line in lines:
+                fixed_lines.append(line)
+                if _DEF_LINE_RE.match(line):
+                    pad = ' ' * (len(line) - len(line.lstrip()) + 4)
                     # Add basic docstring
-                    fixed_lines.append(' ' * (indent + 4) + '"""')
-                    fixed_lines.append(' ' * (indent + 4) + 'TODO: Add function description')
-                    fixed_lines.append(' ' * (indent + 4) + '"""')
-                else:
-                    fixed_lines.append(line)
+                    fixed_lines.extend((f'{pad}"""', f'{pad}TODO: Add function description', f'{pad}"""'))
             
             return '\n'.join(fixed_lines)
         
         return content
     
-    async def _fix_missing_section(self, content: str, issue: QualityIssue) -> str:
+    async def _fix_missing_section(self, work_item: WorkItem, issue: QualityIssue) -> str:
         """Add missing section to documentation"""
+        content = work_item.content
         section_templates = {
             "overview": "## Overview\n\nTODO: Add project overview\n",
             "usage": "## Usage\n\nTODO: Add usage instructions\n",
@@ -787,7 +1334,7 @@ class AutoFixEngine:
         }
         
         # Extract section name from issue description
-        section_match = re.search(r'section:\s+(\w+)', issue.description)
+        section_match = _MISSING_SECTION_RE.search(issue.description)
         if section_match:
             section = section_match.group(1)
             template = section_templates.get(section, f"## {section.title()}\n\nTODO: Add {section} content\n")
@@ -795,8 +1342,9 @@ class AutoFixEngine:
         
         return content
     
-    async def _fix_missing_test_type(self, content: str, issue: QualityIssue) -> str:
+    async def _fix_missing_test_type(self, work_item: WorkItem, issue: QualityIssue) -> str:
         """Add missing test type"""
+        content = work_item.content
         test_templates = {
             "unit": '''
 def test_unit_example():
@@ -813,7 +1361,7 @@ def test_integration_example():
         }
         
         # Extract test type from issue description
-        test_match = re.search(r'Missing\s+(\w+)\s+tests', issue.description)
+        test_match = _MISSING_TEST_RE.search(issue.description)
         if test_match:
             test_type = test_match.group(1)
             template = test_templates.get(test_type, f'''
@@ -825,22 +1373,95 @@ def test_{test_type}_example():
         
         return content
 
+# File change events are batched until the burst settles, but never held longer than the max delay
+_FILE_CHANGE_DEBOUNCE_SECONDS = 0.25
+_FILE_CHANGE_MAX_DELAY_SECONDS = 1.0
+_WORK_QUEUE_SIZE = 200
+
+# Extensions that decide the work type on their own, before any path checks
+_EXT_TO_WORK_TYPE = {
+    **{ext: WorkType.CODE for ext in ('.py', '.js', '.ts', '.java', '.go', '.rs', '.cpp', '.c')},
+    **{ext: WorkType.DOCUMENTATION for ext in ('.md', '.rst', '.txt')}
+}
+_ARCHITECTURE_EXTS = frozenset({'.yaml', '.yml', '.json'})
+
+# Auto-fix stage: bounded hand-off from review, drained in small batches
+_FIX_QUEUE_SIZE = 256
+_FIX_BATCH_SIZE = 16
+_FIX_BATCH_WAIT_SECONDS = 0.2
+
+# Parsed CLAUDE.md requirements kept per project, re-read only when the file changes
+_REQUIREMENTS_CACHE_SIZE = 100
+
+# Names whose appearance or removal can move a project root; cached roots are also dropped
+# periodically, since those names can change outside the watched directories
+_PROJECT_ROOT_MARKERS = frozenset({"CLAUDE.md", ".git"})
+_PROJECT_ROOT_TTL_SECONDS = 300
+
+@lru_cache(maxsize=1024)
+def _find_root_for_dir(dirpath: str) -> str:
+    """Nearest ancestor of a directory holding CLAUDE.md or .git"""
+    current = dirpath
+    
+    while current != "/":
+        if os.path.exists(os.path.join(current, "CLAUDE.md")) or \
+           os.path.exists(os.path.join(current, ".git")):
+            return current
+        current = os.path.dirname(current)
+    
+    return dirpath
+
+def _redis_hash(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Hash fields Redis accepts: nested values, bools and None stored as JSON"""
+    return {
+        key: value if isinstance(value, (str, bytes, int, float)) and not isinstance(value, bool) else json.dumps(value)
+        for key, value in data.items()
+    }
+
 class CEOQualityControlAgent:
     """Main CEO/Quality Control Agent"""
     
     def __init__(self, config_path: str = "/mnt/c/bmad-workspace/config/ceo-config.yaml"):
         self.config_path = config_path
         self.config = self._load_config()
-        self.work_queue = asyncio.Queue()
+        # File filters, compiled once from the monitoring config
+        monitoring = self.config["monitoring"]
+        self._include_suffixes = tuple(pattern.replace("*", "") for pattern in monitoring["file_patterns"])
+        exclude_patterns = monitoring["exclude_patterns"]
+        self._exclude_re = re.compile("|".join(map(re.escape, exclude_patterns))) if exclude_patterns else None
+        self.work_queue = asyncio.Queue(maxsize=_WORK_QUEUE_SIZE)
+        # Review workers draining the queue, and a cap on engine reviews in flight across them and the fix stage
+        self.review_workers = max(1, int(self.config["agents"]["max_concurrent_reviews"]))
+        self._review_slots = asyncio.Semaphore(self.review_workers)
+        self.fix_queue = asyncio.Queue(maxsize=_FIX_QUEUE_SIZE)
         self.active_reviews = {}
-        self.quality_engine = QualityReviewEngine()
-        self.auto_fix_engine = AutoFixEngine()
         self.redis_client = self._init_redis()
+        self.quality_engine = QualityReviewEngine(self.redis_client)
+        self.auto_fix_engine = AutoFixEngine()
         self.file_observer = None
         self.running = False
         
+        # Changed files waiting for the debounce timer: path -> time of last event
+        self._pending_changes: Dict[str, float] = {}
+        self._pending_since = 0.0
+        self._change_flush: Optional[asyncio.TimerHandle] = None
+        # Batches being turned into work items; held so they are not collected mid-run
+        self._change_tasks: Set[asyncio.Task] = set()
+        
+        # Review hashes waiting to be written to Redis together at the end of a batch
+        self._pending_review_writes: List[Dict[str, Any]] = []
+        
+        # When the cached project roots were last cleared
+        self._project_roots_since = time.monotonic()
+        
+        # CLAUDE.md path -> (mtime, size, requirements), least recently used first
+        self._requirements_cache: OrderedDict[str, Tuple[float, int, Tuple[str, ...]]] = OrderedDict()
+        
         # Agent tracking
         self.agent_performance = {}
+        # Running totals across agents, kept in step with agent_performance for the reports
+        self._agent_score_total = 0.0
+        self._agent_review_count = 0
         self.project_standards = {}
         self.quality_reports = []
         
@@ -883,7 +1504,7 @@ class CEOQualityControlAgent:
         try:
             if os.path.exists(self.config_path):
                 with open(self.config_path, 'r') as f:
-                    config = yaml.safe_load(f)
+                    config = yaml.load(f, Loader=SafeLoader)
                     return {**default_config, **config}
         except Exception as e:
             logger.error(f"Error loading config: {e}")
@@ -893,7 +1514,9 @@ class CEOQualityControlAgent:
     def _init_redis(self) -> redis.Redis:
         """Initialize Redis connection"""
         try:
-            return redis.Redis(host='localhost', port=6379, db=2)
+            # One bounded pool shared by every caller, so connections are reused rather than reopened
+            pool = redis.ConnectionPool(host='localhost', port=6379, db=2, max_connections=32)
+            return redis.Redis(connection_pool=pool)
         except Exception as e:
             logger.error(f"Redis connection failed: {e}")
             return None
@@ -908,7 +1531,8 @@ class CEOQualityControlAgent:
         
         # Start work processing
         tasks = [
-            asyncio.create_task(self._process_work_queue()),
+            *(asyncio.create_task(self._process_work_queue()) for _ in range(self.review_workers)),
+            asyncio.create_task(self._process_fix_queue()),
             asyncio.create_task(self._monitor_agent_performance()),
             asyncio.create_task(self._generate_reports()),
             asyncio.create_task(self._health_check_loop())
@@ -922,18 +1546,37 @@ class CEOQualityControlAgent:
             logger.info("CEO Quality Control Agent shutting down...")
         finally:
             self.running = False
+            if self._change_flush:
+                self._change_flush.cancel()
+            for task in list(self._change_tasks):
+                task.cancel()
             if self.file_observer:
                 self.file_observer.stop()
+            self.quality_engine.shutdown()
+            # Write out the last batch of review results before letting go of Redis
+            await self._flush_review_writes()
+            if self.redis_client:
+                self.redis_client.close()
     
     async def _start_file_monitoring(self):
         """Start monitoring files for changes"""
+        loop = asyncio.get_running_loop()
+        
         class QualityFileHandler(FileSystemEventHandler):
             def __init__(self, ceo_agent):
                 self.ceo_agent = ceo_agent
             
             def on_modified(self, event):
+                # Events arrive on the observer thread; hand them to the loop
                 if not event.is_directory:
-                    asyncio.create_task(self.ceo_agent._handle_file_change(event.src_path))
+                    loop.call_soon_threadsafe(self.ceo_agent._note_file_change, event.src_path)
+            
+            def on_any_event(self, event):
+                # Creating, deleting or moving a CLAUDE.md or .git can move project roots
+                if event.event_type in ("created", "deleted", "moved"):
+                    paths = (event.src_path, getattr(event, "dest_path", "") or "")
+                    if any(os.path.basename(os.fsdecode(path)) in _PROJECT_ROOT_MARKERS for path in paths):
+                        loop.call_soon_threadsafe(self.ceo_agent._forget_project_roots)
         
         self.file_observer = Observer()
         handler = QualityFileHandler(self)
@@ -945,84 +1588,133 @@ class CEOQualityControlAgent:
         self.file_observer.start()
         logger.info("📁 File monitoring started")
     
+    def _note_file_change(self, file_path: str):
+        """Add a changed file to the pending batch and restart the debounce timer"""
+        # A new or edited CLAUDE.md can move project roots
+        if os.path.basename(file_path) == "CLAUDE.md":
+            self._forget_project_roots()
+        
+        # Files that won't be reviewed shouldn't hold back the ones that will
+        if not self._should_review_file(file_path):
+            return
+        
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        
+        if not self._pending_changes:
+            self._pending_since = now
+        self._pending_changes[file_path] = now
+        
+        if self._change_flush:
+            self._change_flush.cancel()
+        delay = min(_FILE_CHANGE_DEBOUNCE_SECONDS, self._pending_since + _FILE_CHANGE_MAX_DELAY_SECONDS - now)
+        self._change_flush = loop.call_later(max(delay, 0.0), self._flush_file_changes)
+    
+    def _flush_file_changes(self):
+        """Send the settled batch of changed files for review"""
+        self._change_flush = None
+        file_paths = list(self._pending_changes)
+        self._pending_changes.clear()
+        task = asyncio.create_task(self._handle_file_changes(file_paths))
+        self._change_tasks.add(task)
+        task.add_done_callback(self._file_changes_done)
+    
+    def _file_changes_done(self, task: asyncio.Task):
+        """Forget a finished file change task, logging it if it failed"""
+        self._change_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"Error queueing changed files: {task.exception()}")
+    
     async def _handle_file_change(self, file_path: str):
         """Handle file changes for quality review"""
+        await self._handle_file_changes([file_path])
+    
+    async def _handle_file_changes(self, file_paths: List[str]):
+        """Queue one review batch for a set of changed files"""
+        work_items = await asyncio.gather(*(self._create_work_item(file_path) for file_path in file_paths))
+        work_items = [work_item for work_item in work_items if work_item]
+        
+        if work_items:
+            await self.work_queue.put(work_items)
+            logger.info("📋 Queued for review: %s", ', '.join(work_item.file_path for work_item in work_items))
+    
+    async def _create_work_item(self, file_path: str) -> Optional[WorkItem]:
+        """Build a work item for a changed file, or None if it should not be reviewed"""
         try:
             # Check if file should be reviewed
             if not self._should_review_file(file_path):
-                return
+                return None
             
             # Determine work type
             work_type = self._determine_work_type(file_path)
             
-            # Read file content
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            # Read file content, git author and project requirements concurrently
+            content, agent_name, requirements = await asyncio.gather(
+                self._read_file(file_path),
+                self._detect_agent_from_file(file_path),
+                self._get_project_requirements(file_path)
+            )
             
             # Create work item
             work_item = WorkItem(
-                id=hashlib.md5(f"{file_path}_{datetime.now()}".encode()).hexdigest(),
+                id=secrets.token_hex(16),
                 work_type=work_type,
                 file_path=file_path,
-                agent_name=self._detect_agent_from_file(file_path),
+                agent_name=agent_name,
                 project_name=self._extract_project_name(file_path),
                 content=content,
-                requirements=self._get_project_requirements(file_path)
+                requirements=requirements
             )
             
-            # Add to queue
-            await self.work_queue.put(work_item)
-            logger.info(f"📋 Queued for review: {file_path}")
+            return work_item
             
         except Exception as e:
             logger.error(f"Error handling file change {file_path}: {e}")
+            return None
+    
+    async def _read_file(self, file_path: str) -> str:
+        """Read a file without blocking the event loop"""
+        async with aiofiles.open(file_path, 'r', encoding='utf-8') as f:
+            return await f.read()
     
     def _should_review_file(self, file_path: str) -> bool:
         """Check if file should be reviewed"""
-        # Check file patterns
-        file_patterns = self.config["monitoring"]["file_patterns"]
-        exclude_patterns = self.config["monitoring"]["exclude_patterns"]
-        
-        # Check exclude patterns first
-        for pattern in exclude_patterns:
-            if pattern in file_path:
-                return False
-        
-        # Check include patterns
-        for pattern in file_patterns:
-            if file_path.endswith(pattern.replace("*", "")):
-                return True
+        # Check exclude patterns first (plain substrings), then include suffixes
+        if self._exclude_re is not None and self._exclude_re.search(file_path):
+            return False
         
-        return False
+        return file_path.endswith(self._include_suffixes)
     
     def _determine_work_type(self, file_path: str) -> WorkType:
         """Determine work type based on file"""
-        file_ext = Path(file_path).suffix.lower()
+        file_ext = os.path.splitext(file_path)[1].lower()
         
-        if file_ext in ['.py', '.js', '.ts', '.java', '.go', '.rs', '.cpp', '.c']:
-            return WorkType.CODE
-        elif file_ext in ['.md', '.rst', '.txt']:
-            return WorkType.DOCUMENTATION
-        elif 'test' in file_path.lower() or file_path.endswith('_test.py'):
+        work_type = _EXT_TO_WORK_TYPE.get(file_ext)
+        if work_type is not None:
+            return work_type
+        
+        lowered_path = file_path.lower()
+        if 'test' in lowered_path:
             return WorkType.TESTS
-        elif file_ext in ['.yaml', '.yml', '.json'] and 'architect' in file_path.lower():
+        elif file_ext in _ARCHITECTURE_EXTS and 'architect' in lowered_path:
             return WorkType.ARCHITECTURE
         else:
             return WorkType.CODE
     
-    def _detect_agent_from_file(self, file_path: str) -> str:
+    async def _detect_agent_from_file(self, file_path: str) -> str:
         """Detect which agent worked on the file"""
         # Look for agent signatures in git history or file metadata
         try:
-            result = subprocess.run(
-                ['git', 'log', '-1', '--format=%cn', file_path],
-                capture_output=True,
-                text=True,
+            process = await asyncio.create_subprocess_exec(
+                'git', 'log', '-1', '--format=%cn', file_path,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
                 cwd=os.path.dirname(file_path)
             )
+            stdout, _ = await process.communicate()
             
-            if result.returncode == 0:
-                return result.stdout.strip()
+            if process.returncode == 0:
+                return stdout.decode().strip()
         except Exception:
             pass
         
@@ -1040,7 +1732,7 @@ class CEOQualityControlAgent:
         
         return "unknown_project"
     
-    def _get_project_requirements(self, file_path: str) -> List[str]:
+    async def _get_project_requirements(self, file_path: str) -> List[str]:
         """Get project requirements from CLAUDE.md or other sources"""
         requirements = []
         
@@ -1048,59 +1740,102 @@ class CEOQualityControlAgent:
         project_dir = self._find_project_root(file_path)
         claude_md_path = os.path.join(project_dir, "CLAUDE.md")
         
-        if os.path.exists(claude_md_path):
-            try:
-                with open(claude_md_path, 'r') as f:
-                    content = f.read()
-                    # Extract requirements from CLAUDE.md
-                    if "requirements:" in content.lower():
-                        # Simple extraction - in practice, you'd parse YAML frontmatter
-                        req_section = content.split("requirements:")[-1].split("\n")
-                        for line in req_section:
-                            if line.strip().startswith("-"):
-                                requirements.append(line.strip()[1:].strip())
-            except Exception as e:
-                logger.error(f"Error reading CLAUDE.md: {e}")
+        try:
+            st = os.stat(claude_md_path)
+        except OSError:
+            return requirements
+        
+        cached = self._requirements_cache.get(claude_md_path)
+        if cached is not None and cached[0] == st.st_mtime and cached[1] == st.st_size:
+            self._requirements_cache.move_to_end(claude_md_path)
+            return list(cached[2])
+        
+        try:
+            async with aiofiles.open(claude_md_path, 'r') as f:
+                content = await f.read()
+                # Extract requirements from CLAUDE.md
+                if "requirements:" in content.lower():
+                    # Simple extraction - in practice, you'd parse YAML frontmatter
+                    req_section = content.rpartition("requirements:")[2].split("\n")
+                    for line in req_section:
+                        line = line.strip()
+                        if line.startswith("-"):
+                            requirements.append(line[1:].strip())
+        except Exception as e:
+            logger.error(f"Error reading CLAUDE.md: {e}")
+            return requirements
+        
+        self._requirements_cache[claude_md_path] = (st.st_mtime, st.st_size, tuple(requirements))
+        self._requirements_cache.move_to_end(claude_md_path)
+        if len(self._requirements_cache) > _REQUIREMENTS_CACHE_SIZE:
+            self._requirements_cache.popitem(last=False)
         
         return requirements
     
     def _find_project_root(self, file_path: str) -> str:
         """Find project root directory"""
-        current = os.path.dirname(file_path)
-        
-        while current != "/":
-            if os.path.exists(os.path.join(current, "CLAUDE.md")) or \
-               os.path.exists(os.path.join(current, ".git")):
-                return current
-            current = os.path.dirname(current)
-        
-        return os.path.dirname(file_path)
+        if time.monotonic() - self._project_roots_since >= _PROJECT_ROOT_TTL_SECONDS:
+            self._forget_project_roots()
+        return _find_root_for_dir(os.path.dirname(file_path))
+    
+    def _forget_project_roots(self):
+        """Drop cached project roots so they are looked up again"""
+        _find_root_for_dir.cache_clear()
+        self._project_roots_since = time.monotonic()
     
     async def _process_work_queue(self):
         """Process work items from queue"""
         while self.running:
             try:
-                # Get work item with timeout
-                work_item = await asyncio.wait_for(self.work_queue.get(), timeout=1.0)
+                # Get a batch of work items with timeout
+                work_items = await asyncio.wait_for(self.work_queue.get(), timeout=1.0)
                 
-                # Process the work item
-                await self._review_work_item(work_item)
+                # Review the batch in one engine call, then act on each result concurrently
+                await self._review_work_items(work_items)
+                await self._flush_review_writes()
                 
             except asyncio.TimeoutError:
                 continue
             except Exception as e:
                 logger.error(f"Error processing work queue: {e}")
     
-    async def _review_work_item(self, work_item: WorkItem):
-        """Review a work item for quality"""
-        logger.info(f"🔍 Reviewing: {work_item.file_path} by {work_item.agent_name}")
+    async def _review_work_items(self, work_items: List[WorkItem]):
+        """Review a batch of work items together and act on each result"""
+        for work_item in work_items:
+            logger.info("🔍 Reviewing: %s by %s", work_item.file_path, work_item.agent_name)
+            self.active_reviews[work_item.id] = work_item
+        
+        reviews = await self._run_reviews(work_items)
+        
+        for work_item, review in zip(work_items, reviews):
+            if review is None:
+                work_item.status = "error"
+                self.active_reviews.pop(work_item.id, None)
+        
+        await asyncio.gather(*(
+            self._handle_review_result(work_item, *review)
+            for work_item, review in zip(work_items, reviews) if review is not None
+        ))
+    
+    async def _run_reviews(self, work_items: List[WorkItem]) -> List[Optional[Tuple[QualityStandard, List[QualityIssue]]]]:
+        """Engine reviews for a batch; if the batch fails, each item is retried alone so one bad file fails only itself"""
+        try:
+            async with self._review_slots:
+                return await self.quality_engine.review_work_items(work_items)
+        except Exception as e:
+            if len(work_items) == 1:
+                logger.error(f"Error reviewing work item {work_items[0].id}: {e}")
+                return [None]
+            logger.warning(f"Batch review failed, reviewing {len(work_items)} work items one at a time: {e}")
+        
+        reviews = await asyncio.gather(*(self._run_reviews([work_item]) for work_item in work_items))
+        return [review for (review,) in reviews]
+    
+    async def _handle_review_result(self, work_item: WorkItem, quality_standard: QualityStandard, issues: List[QualityIssue]):
+        """Approve, auto-fix or send back a reviewed work item"""
+        handed_to_fix = False
         
         try:
-            # Add to active reviews
-            self.active_reviews[work_item.id] = work_item
-            
-            # Perform quality review
-            quality_standard, issues = await self.quality_engine.review_work_item(work_item)
             work_item.issues = issues
             
             # Update dashboard
@@ -1111,31 +1846,20 @@ class CEOQualityControlAgent:
                 # Approve the work
                 work_item.status = "approved"
                 self.dashboard_data["passed_reviews"] += 1
-                logger.info(f"✅ APPROVED: {work_item.file_path} - Quality: {quality_standard.value}")
+                logger.info("✅ APPROVED: %s - Quality: %s", work_item.file_path, quality_standard.value)
                 
             elif quality_standard == QualityStandard.ACCEPTABLE:
                 # Approve with minor notes
                 work_item.status = "approved"
                 self.dashboard_data["passed_reviews"] += 1
-                logger.info(f"✅ APPROVED (with notes): {work_item.file_path}")
+                logger.info("✅ APPROVED (with notes): %s", work_item.file_path)
                 
             elif quality_standard == QualityStandard.NEEDS_IMPROVEMENT:
-                # Try auto-fix first
+                # Try auto-fix first, in its own stage so it does not hold up reviews
                 if self.config["quality_standards"]["auto_fix_enabled"]:
-                    fixed_count = await self._attempt_auto_fixes(work_item)
-                    if fixed_count > 0:
-                        # Re-review after fixes
-                        quality_standard, issues = await self.quality_engine.review_work_item(work_item)
-                        work_item.issues = issues
-                        
-                        if quality_standard in [QualityStandard.EXCELLENT, QualityStandard.GOOD, QualityStandard.ACCEPTABLE]:
-                            work_item.status = "approved"
-                            self.dashboard_data["passed_reviews"] += 1
-                            logger.info(f"✅ APPROVED after auto-fix: {work_item.file_path}")
-                        else:
-                            await self._send_for_revision(work_item)
-                    else:
-                        await self._send_for_revision(work_item)
+                    await self.fix_queue.put(work_item)
+                    handed_to_fix = True
+                    return
                 else:
                     await self._send_for_revision(work_item)
                     
@@ -1154,7 +1878,61 @@ class CEOQualityControlAgent:
             work_item.status = "error"
         
         finally:
-            # Remove from active reviews
+            # Remove from active reviews, unless the fix stage still owns it
+            if not handed_to_fix and work_item.id in self.active_reviews:
+                del self.active_reviews[work_item.id]
+    
+    async def _process_fix_queue(self):
+        """Auto-fix work items from the fix queue in batches"""
+        while self.running:
+            try:
+                batch = [await asyncio.wait_for(self.fix_queue.get(), timeout=1.0)]
+                
+                # Collect whatever else arrives shortly after, up to a full batch
+                while len(batch) < _FIX_BATCH_SIZE:
+                    try:
+                        batch.append(await asyncio.wait_for(self.fix_queue.get(), timeout=_FIX_BATCH_WAIT_SECONDS))
+                    except asyncio.TimeoutError:
+                        break
+                
+                await asyncio.gather(*(self._auto_fix_work_item(work_item) for work_item in batch))
+                await self._flush_review_writes()
+                
+            except asyncio.TimeoutError:
+                continue
+            except Exception as e:
+                logger.error(f"Error processing fix queue: {e}")
+    
+    async def _auto_fix_work_item(self, work_item: WorkItem):
+        """Auto-fix a work item that needs improvement and re-review it"""
+        try:
+            fixed_count = await self._attempt_auto_fixes(work_item)
+            if fixed_count > 0:
+                # Re-review after fixes
+                async with self._review_slots:
+                    quality_standard, issues = await self.quality_engine.review_work_item(work_item)
+                work_item.issues = issues
+                
+                if quality_standard in [QualityStandard.EXCELLENT, QualityStandard.GOOD, QualityStandard.ACCEPTABLE]:
+                    work_item.status = "approved"
+                    self.dashboard_data["passed_reviews"] += 1
+                    logger.info("✅ APPROVED after auto-fix: %s", work_item.file_path)
+                else:
+                    await self._send_for_revision(work_item)
+            else:
+                await self._send_for_revision(work_item)
+            
+            # Store review results
+            await self._store_review_results(work_item)
+            
+            # Update agent performance
+            self._update_agent_performance(work_item)
+            
+        except Exception as e:
+            logger.error(f"Error auto-fixing work item {work_item.id}: {e}")
+            work_item.status = "error"
+        
+        finally:
             if work_item.id in self.active_reviews:
                 del self.active_reviews[work_item.id]
     
@@ -1171,9 +1949,9 @@ class CEOQualityControlAgent:
         # Write fixed content back to file
         if fixed_count > 0:
             try:
-                with open(work_item.file_path, 'w', encoding='utf-8') as f:
-                    f.write(work_item.content)
-                logger.info(f"🔧 Auto-fixed {fixed_count} issues in {work_item.file_path}")
+                async with aiofiles.open(work_item.file_path, 'w', encoding='utf-8') as f:
+                    await f.write(work_item.content)
+                logger.info("🔧 Auto-fixed %d issues in %s", fixed_count, work_item.file_path)
             except Exception as e:
                 logger.error(f"Error writing auto-fixes: {e}")
                 fixed_count = 0
@@ -1246,8 +2024,8 @@ class CEOQualityControlAgent:
                 f".revision-{work_item.id}.md"
             )
             
-            with open(revision_file, 'w') as f:
-                f.write(instructions)
+            async with aiofiles.open(revision_file, 'w') as f:
+                await f.write(instructions)
             
             # Send notification via Claude Code or tmux
             await self._send_agent_notification(work_item.agent_name, instructions)
@@ -1261,13 +2039,16 @@ class CEOQualityControlAgent:
             # Try to send via tmux session
             tmux_session = f"{agent_name}-session"
             
-            result = subprocess.run([
+            process = await asyncio.create_subprocess_exec(
                 "/mnt/c/bmad-workspace/Tmux-Orchestrator/send-claude-message.sh",
                 tmux_session,
-                f"CEO QUALITY CONTROL: {message}"
-            ], capture_output=True, text=True)
+                f"CEO QUALITY CONTROL: {message}",
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
+            await process.communicate()
             
-            if result.returncode == 0:
+            if process.returncode == 0:
                 logger.info(f"📨 Sent revision notification to {agent_name}")
             else:
                 logger.warning(f"Failed to send notification to {agent_name}")
@@ -1345,25 +2126,37 @@ class CEOQualityControlAgent:
                 "timestamp": work_item.timestamp.isoformat()
             }
             
-            # Store in Redis for quick access
+            # Store in Redis for quick access, batched with the rest of the drain cycle
             if self.redis_client:
-                self.redis_client.hset(
-                    f"review:{work_item.id}",
-                    mapping=review_data
-                )
-                self.redis_client.expire(f"review:{work_item.id}", 86400)  # 24 hours
+                self._pending_review_writes.append(review_data)
             
             # Store in file for persistence
             reviews_dir = "/mnt/c/bmad-workspace/logs/reviews"
-            os.makedirs(reviews_dir, exist_ok=True)
+            await aiofiles.os.makedirs(reviews_dir, exist_ok=True)
             
             review_file = os.path.join(reviews_dir, f"review-{work_item.id}.json")
-            with open(review_file, 'w') as f:
-                json.dump(review_data, f, indent=2)
+            async with aiofiles.open(review_file, 'w') as f:
+                await f.write(json.dumps(review_data, indent=2))
             
         except Exception as e:
             logger.error(f"Error storing review results: {e}")
     
+    async def _flush_review_writes(self):
+        """Write pending review results to Redis in one pipelined round trip"""
+        if not self._pending_review_writes:
+            return
+        reviews, self._pending_review_writes = self._pending_review_writes, []
+        
+        pipe = self.redis_client.pipeline(transaction=False)
+        for review_data in reviews:
+            key = f"review:{review_data['work_item_id']}"
+            pipe.hset(key, mapping=_redis_hash(review_data))
+            pipe.expire(key, 86400)  # 24 hours
+        try:
+            await asyncio.to_thread(pipe.execute)
+        except Exception as e:
+            logger.error(f"Error storing review results in Redis: {e}")
+    
     def _update_agent_performance(self, work_item: WorkItem):
         """Update agent performance metrics"""
         agent_name = work_item.agent_name
@@ -1387,11 +2180,13 @@ class CEOQualityControlAgent:
         else:
             agent_stats["failed_reviews"] += 1
         
-        # Update average quality score
-        agent_stats["avg_quality_score"] = (
-            (agent_stats["avg_quality_score"] * (agent_stats["total_reviews"] - 1) +
-             work_item.quality_metrics.overall_score) / agent_stats["total_reviews"]
+        # Update average quality score incrementally, and the cross-agent totals with it
+        previous_avg = agent_stats["avg_quality_score"]
+        agent_stats["avg_quality_score"] += (
+            (work_item.quality_metrics.overall_score - previous_avg) / agent_stats["total_reviews"]
         )
+        self._agent_score_total += agent_stats["avg_quality_score"] - previous_avg
+        self._agent_review_count += 1
         
         # Update revision rate
         agent_stats["revision_rate"] = agent_stats["failed_reviews"] / agent_stats["total_reviews"]
@@ -1427,12 +2222,8 @@ class CEOQualityControlAgent:
                 "agents": self.agent_performance,
                 "overall_metrics": {
                     "total_agents": len(self.agent_performance),
-                    "avg_quality_score": sum(
-                        agent["avg_quality_score"] for agent in self.agent_performance.values()
-                    ) / len(self.agent_performance) if self.agent_performance else 0,
-                    "total_reviews": sum(
-                        agent["total_reviews"] for agent in self.agent_performance.values()
-                    ),
+                    "avg_quality_score": self._agent_score_total / len(self.agent_performance) if self.agent_performance else 0,
+                    "total_reviews": self._agent_review_count,
                     "overall_pass_rate": self.dashboard_data["passed_reviews"] / 
                                         self.dashboard_data["total_reviews"] if self.dashboard_data["total_reviews"] > 0 else 0
                 }
@@ -1732,8 +2523,10 @@ class CEOQualityControlAgent:
             
             # Store health status
             if self.redis_client:
-                self.redis_client.hset("ceo:health", mapping=health_status)
-                self.redis_client.expire("ceo:health", 600)  # 10 minutes
+                pipe = self.redis_client.pipeline(transaction=False)
+                pipe.hset("ceo:health", mapping=_redis_hash(health_status))
+                pipe.expire("ceo:health", 600)  # 10 minutes
+                await asyncio.to_thread(pipe.execute)
             
         except Exception as e:
             logger.error(f"Error performing health check: {e}")
@@ -1793,6 +2586,15 @@ class CEOQualityControlAgent:
         except Exception as e:
             logger.error(f"Error updating CEO dashboard: {e}")
 
+def _queue_logging() -> logging.handlers.QueueListener:
+    """Move the root log handlers onto a listener thread so logging calls only enqueue"""
+    root = logging.getLogger()
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, *root.handlers, respect_handler_level=True)
+    root.handlers = [logging.handlers.QueueHandler(log_queue)]
+    listener.start()
+    return listener
+
 async def main():
     """Main function to run the CEO Quality Control Agent"""
     import argparse
@@ -1817,23 +2619,27 @@ async def main():
     # Create logs directory
     os.makedirs('/mnt/c/bmad-workspace/logs', exist_ok=True)
     
+    log_listener = _queue_logging()
+    
     # Initialize and start the CEO agent
     ceo_agent = CEOQualityControlAgent(args.config)
     
-    if args.test:
-        logger.info("Running in test mode...")
-        # Run basic tests
-        await ceo_agent._perform_health_check()
-        logger.info("Test completed successfully")
-        return
-    
     try:
+        if args.test:
+            logger.info("Running in test mode...")
+            # Run basic tests
+            await ceo_agent._perform_health_check()
+            logger.info("Test completed successfully")
+            return
+        
         await ceo_agent.start()
     except KeyboardInterrupt:
         logger.info("CEO Quality Control Agent stopped by user")
     except Exception as e:
         logger.error(f"CEO Quality Control Agent crashed: {e}")
         raise
+    finally:
+        log_listener.stop()  # Flushes queued records
 
 if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file
@@ -0,0 +1,155 @@
+"""
+Unit tests for the CEO quality control review engine: batching, the review cache and the shared cache.
+"""
+import pytest
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+from pathlib import Path
+import sys
+
+# The agent lives in a hyphenated script, so load it by path
+_AGENT_PATH = Path(__file__).resolve().parents[3] / "src" / "ceo-quality-control-agent.py"
+_spec = importlib.util.spec_from_file_location("ceo_quality_control_agent", _AGENT_PATH)
+ceo = importlib.util.module_from_spec(_spec)
+sys.modules[_spec.name] = ceo
+_spec.loader.exec_module(ceo)
+
+# Large enough to be cached (at least _REVIEW_CACHE_MIN_CHARS), small enough to stay off the pool
+CACHEABLE_CONTENT = 'def handler():\n    """Handle a request"""\n    return 1\n' * 40
+
+class RecordingExecutor(ThreadPoolExecutor):
+    """Thread pool standing in for the process pool, recording the batches it is given."""
+
+    def __init__(self):
+        super().__init__(max_workers=2)
+        self.batches = []
+
+    def submit(self, fn, *args, **kwargs):
+        self.batches.append([work_item.file_path for work_item in args[0]])
+        return super().submit(fn, *args, **kwargs)
+
+def make_work_item(file_path, content=CACHEABLE_CONTENT):
+    """Build a code work item for review."""
+    return ceo.WorkItem(
+        id=file_path,
+        work_type=ceo.WorkType.CODE,
+        file_path=file_path,
+        agent_name="test_agent",
+        project_name="test_project",
+        content=content,
+        requirements=[]
+    )
+
+@pytest.mark.unit
+class TestReviewBatching:
+    """Test suite for batched reviews."""
+
+    @pytest.mark.asyncio
+    async def test_large_batches_split_across_pool(self, temp_workspace):
+        """Test that a batch over the pool threshold is split into review_batch_size chunks in order."""
+        engine = ceo.QualityReviewEngine()
+        engine.review_batch_size = 2
+        executor = engine.review_executor = RecordingExecutor()
+        paths = [str(temp_workspace / f"module_{i}.js") for i in range(5)]
+
+        try:
+            with patch.object(ceo, "_REVIEW_POOL_MIN_CHARS", 0):
+                results = await engine.review_work_items([make_work_item(path, "const x = 1;\n") for path in paths])
+        finally:
+            engine.shutdown()
+
+        assert executor.batches == [paths[0:2], paths[2:4], paths[4:5]]
+        assert engine.review_executor is None
+        assert len(results) == 5
+        for path, (quality_standard, issues) in zip(paths, results):
+            assert isinstance(quality_standard, ceo.QualityStandard)
+            assert all(issue.file_path == path for issue in issues)
+
+    @pytest.mark.asyncio
+    async def test_small_batches_stay_off_the_pool(self, temp_workspace):
+        """Test that a small batch is analysed in one thread call without starting the pool."""
+        engine = ceo.QualityReviewEngine()
+        work_items = [make_work_item(str(temp_workspace / f"module_{i}.js"), "const x = 1;\n") for i in range(3)]
+
+        with patch.object(ceo, "_analyze_work_items_in_worker", wraps=ceo._analyze_work_items_in_worker) as worker:
+            results = await engine.review_work_items(work_items)
+
+        assert worker.call_count == 1
+        assert worker.call_args.args[0] == work_items
+        assert engine.review_executor is None
+        assert len(results) == 3
+
+@pytest.mark.unit
+class TestReviewCache:
+    """Test suite for the local review cache."""
+
+    @pytest.mark.asyncio
+    async def test_unchanged_content_is_served_from_cache(self, temp_workspace):
+        """Test that a resubmitted file with the same content digest is not analysed again."""
+        engine = ceo.QualityReviewEngine()
+        path = str(temp_workspace / "service.js")
+
+        with patch.object(engine, "_analyze_work_items", wraps=engine._analyze_work_items) as analyze:
+            first = await engine.review_work_item(make_work_item(path))
+            second = await engine.review_work_item(make_work_item(path))
+
+        assert [len(call.args[0]) for call in analyze.call_args_list] == [1, 0]
+        assert first == second
+
+    @pytest.mark.asyncio
+    async def test_changed_content_misses_cache(self, temp_workspace):
+        """Test that a new content digest for the same path is analysed again."""
+        engine = ceo.QualityReviewEngine()
+        path = str(temp_workspace / "service.js")
+
+        with patch.object(engine, "_analyze_work_items", wraps=engine._analyze_work_items) as analyze:
+            await engine.review_work_item(make_work_item(path))
+            await engine.review_work_item(make_work_item(path, CACHEABLE_CONTENT + "// changed\n"))
+
+        assert [len(call.args[0]) for call in analyze.call_args_list] == [1, 1]
+        assert len(engine._review_cache) == 2
+
+@pytest.mark.unit
+class TestSharedReviewCache:
+    """Test suite for the Redis-backed shared review cache."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("payload", [
+        b"{not json",
+        b'{"issues": [{"unknown_field": 1}], "metrics": {}}',
+        b"[]",
+    ])
+    async def test_malformed_payload_is_a_cache_miss(self, temp_workspace, payload):
+        """Test that an unreadable shared review is ignored, reviewed fresh and overwritten."""
+        redis_client = MagicMock()
+        redis_client.mget.return_value = [payload]
+        engine = ceo.QualityReviewEngine(redis_client)
+
+        quality_standard, issues = await engine.review_work_item(make_work_item(str(temp_workspace / "api.js")))
+
+        assert isinstance(quality_standard, ceo.QualityStandard)
+        redis_client.mget.assert_called_once()
+        pipe = redis_client.pipeline.return_value
+        pipe.setex.assert_called_once()
+        pipe.execute.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_shared_hit_skips_analysis(self, temp_workspace):
+        """Test that a review stored by another engine is reused without analysis."""
+        path = str(temp_workspace / "api.js")
+        stored = {}
+
+        writer = MagicMock()
+        writer.mget.return_value = [None]
+        writer.pipeline.return_value.setex.side_effect = lambda key, ttl, value: stored.__setitem__(key, value)
+        await ceo.QualityReviewEngine(writer).review_work_item(make_work_item(path))
+
+        reader = MagicMock()
+        reader.mget.side_effect = lambda keys: [stored.get(key) for key in keys]
+        engine = ceo.QualityReviewEngine(reader)
+        with patch.object(engine, "_analyze_work_items", wraps=engine._analyze_work_items) as analyze:
+            await engine.review_work_item(make_work_item(path))
+
+        assert len(stored) == 1
+        assert [len(call.args[0]) for call in analyze.call_args_list] == [0]
@@ -9,10 +9,18 @@ from pathlib import Path
 import sys
 import tempfile
 import os
+import importlib.util
 
 # Mock the orchestrator module since it might not be importable
 sys.modules['autonomous_master_orchestrator'] = Mock()
 
+# The real orchestrator lives in a hyphenated script, so load it by path under its own name
+_ORCHESTRATOR_PATH = Path(__file__).resolve().parents[3] / "src" / "autonomous-master-orchestrator.py"
+_spec = importlib.util.spec_from_file_location("autonomous_master_orchestrator_impl", _ORCHESTRATOR_PATH)
+orchestrator_module = importlib.util.module_from_spec(_spec)
+sys.modules[_spec.name] = orchestrator_module
+_spec.loader.exec_module(orchestrator_module)
+
 class MockOrchestrator:
     """Mock orchestrator for testing."""
     
@@ -110,4 +118,202 @@ class TestOrchestrator:
         assert status["running"] is True
         assert status["agents"] == 2
         assert "memory_usage" in status
-        assert "uptime" in status
\ No newline at end of file
+        assert "uptime" in status
+
+def make_project_config(path, **overrides):
+    """Build a ProjectConfig for checkpoint tests."""
+    return orchestrator_module.ProjectConfig(**{
+        "name": Path(path).name,
+        "path": str(path),
+        "type": orchestrator_module.ProjectType.NEXTJS_APP,
+        "phase": orchestrator_module.ProjectPhase.TESTING,
+        "technologies": ["nextjs", "typescript"],
+        "complexity": "high",
+        "confidence": 0.95,
+        **overrides
+    })
+
+@pytest.mark.unit
+class TestStateCheckpoint:
+    """Test suite for saving and restoring active projects."""
+    
+    @pytest.fixture
+    def orchestrator(self, temp_workspace):
+        """Orchestrator writing its checkpoint inside the temp workspace."""
+        orchestrator = orchestrator_module.AutonomousOrchestrator()
+        orchestrator.state_file = temp_workspace / "orchestrator-state.json"
+        return orchestrator
+    
+    @pytest.mark.asyncio
+    async def test_save_load_round_trip(self, orchestrator, temp_workspace):
+        """Test that saved projects come back as ProjectConfig objects with their enums."""
+        project_dir = temp_workspace / "web"
+        project_dir.mkdir()
+        config = make_project_config(project_dir)
+        claude_config = {"project": {"name": "web"}, "workflows": []}
+        orchestrator.active_projects[str(project_dir)] = {
+            "config": config,
+            "claude_config": claude_config,
+            "activated_at": "2026-01-01T00:00:00",
+            "agents": {"frontend": object()},
+            "agent_ids": orchestrator._team_agent_ids(config)
+        }
+        
+        await orchestrator._save_state()
+        restored = orchestrator._load_state()
+        
+        assert list(restored) == [str(project_dir)]
+        project = restored[str(project_dir)]
+        assert project["config"] == config
+        assert project["config"].type is orchestrator_module.ProjectType.NEXTJS_APP
+        assert project["config"].phase is orchestrator_module.ProjectPhase.TESTING
+        assert project["claude_config"] == claude_config
+        assert project["activated_at"] == "2026-01-01T00:00:00"
+        assert project["agents"] == {}
+        assert project["agent_ids"] == orchestrator._team_agent_ids(config)
+    
+    @pytest.mark.asyncio
+    async def test_missing_directories_are_skipped(self, orchestrator, temp_workspace):
+        """Test that projects whose directory is gone are not restored."""
+        kept_dir = temp_workspace / "kept"
+        gone_dir = temp_workspace / "gone"
+        kept_dir.mkdir()
+        gone_dir.mkdir()
+        for project_dir in (kept_dir, gone_dir):
+            orchestrator.active_projects[str(project_dir)] = {
+                "config": make_project_config(project_dir),
+                "claude_config": None,
+                "activated_at": "2026-01-01T00:00:00"
+            }
+        
+        await orchestrator._save_state()
+        gone_dir.rmdir()
+        
+        assert list(orchestrator._load_state()) == [str(kept_dir)]
+    
+    def test_legacy_state_file_loads_with_defaults(self, orchestrator, temp_workspace):
+        """Test that a state file from before the full checkpoint still loads."""
+        project_dir = temp_workspace / "api"
+        project_dir.mkdir()
+        orchestrator.state_file.write_text(json.dumps({
+            "timestamp": "2025-06-01T12:00:00",
+            "active_projects": {
+                str(project_dir): {
+                    "config": {
+                        "name": "api",
+                        "type": "python_api",
+                        "phase": "development",
+                        "technologies": ["fastapi"]
+                    },
+                    "activated_at": "2025-06-01T12:00:00"
+                }
+            }
+        }, indent=2))
+        
+        project = orchestrator._load_state()[str(project_dir)]
+        
+        assert project["config"].path == str(project_dir)
+        assert project["config"].type is orchestrator_module.ProjectType.PYTHON_API
+        assert project["config"].phase is orchestrator_module.ProjectPhase.DEVELOPMENT
+        assert project["config"].complexity == "medium"
+        assert project["claude_config"] is None
+    
+    @pytest.mark.parametrize("content", [
+        b"{not json",
+        b"[]",
+        b'{"active_projects": []}',
+    ])
+    def test_unreadable_state_file_is_ignored(self, orchestrator, content):
+        """Test that a corrupt or malformed state file restores nothing."""
+        orchestrator.state_file.write_bytes(content)
+        assert orchestrator._load_state() == {}
+    
+    def test_bad_project_entry_is_skipped(self, orchestrator, temp_workspace):
+        """Test that one bad saved project does not stop the others loading."""
+        good_dir = temp_workspace / "good"
+        bad_dir = temp_workspace / "bad"
+        good_dir.mkdir()
+        bad_dir.mkdir()
+        orchestrator.state_file.write_text(json.dumps({
+            "active_projects": {
+                str(bad_dir): {"config": {"name": "bad", "type": "unknown", "phase": "testing"}},
+                str(good_dir): {
+                    "config": {"name": "good", "type": "static_site", "phase": "planning"},
+                    "activated_at": "2026-01-01T00:00:00"
+                }
+            }
+        }))
+        
+        assert list(orchestrator._load_state()) == [str(good_dir)]
+    
+    @pytest.mark.asyncio
+    async def test_shutdown_without_start_keeps_checkpoint(self, orchestrator):
+        """Test that one-shot runs such as --status do not overwrite the saved state."""
+        orchestrator.state_file.write_bytes(b'{"active_projects": {"/srv/app": {}}}')
+        
+        await orchestrator.shutdown()
+        
+        assert orchestrator.state_file.read_bytes() == b'{"active_projects": {"/srv/app": {}}}'
+
+SAMPLE_CLAUDE_MD = """# Web App
+
+<!-- Notes for contributors -->
+## Project
+name: web-app
+  type: nextjs_app  
+
+# Top-level comment: not a setting
+### Not a workflow
+## Context
+
+docs: docs/README.md
+## Workflows
+### Deploy
+triggers: push to main
+actions: run tests
+actions: deploy
+notes: ignored
+### Nightly
+conditions: weekday
+## Memory
+limit: 512MB
+## Tools
+taskmaster: on
+github: enabled
+"""
+
+@pytest.mark.unit
+class TestClaudeMdParser:
+    """Test suite for the CLAUDE.md parser."""
+    
+    @pytest.fixture
+    def handler(self):
+        """Config handler without an orchestrator."""
+        return orchestrator_module.ClaudeConfigHandler(None)
+    
+    def test_sections_workflows_and_items(self, handler):
+        """Test that sections, workflows and key/value items are parsed, skipping comments and blanks."""
+        config = handler._parse_claude_md_advanced(SAMPLE_CLAUDE_MD)
+        
+        assert config["version"] == "1.0"
+        assert config["project"] == {"name": "web-app", "type": "nextjs_app"}
+        assert config["context"] == {"docs": "docs/README.md"}
+        assert config["memory"] == {"limit": "512MB"}
+        assert config["tools"] == ["on", "enabled"]
+        assert config["workflows"] == [
+            {"name": "Deploy", "triggers": ["push to main"], "actions": ["run tests", "deploy"], "conditions": []},
+            {"name": "Nightly", "triggers": [], "actions": [], "conditions": ["weekday"]}
+        ]
+    
+    def test_crlf_line_endings(self, handler):
+        """Test that Windows line endings parse the same as Unix ones."""
+        crlf = handler._parse_claude_md_advanced(SAMPLE_CLAUDE_MD.replace("\n", "\r\n"))
+        assert crlf == handler._parse_claude_md_advanced(SAMPLE_CLAUDE_MD)
+    
+    def test_no_sections_gives_empty_config(self, handler):
+        """Test that settings outside any section are ignored."""
+        config = handler._parse_claude_md_advanced("# Notes\n\nname: orphan\n")
+        
+        assert config["project"] == {}
+        assert config["workflows"] == []
+        assert config["tools"] == []